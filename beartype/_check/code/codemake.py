@@ -21,7 +21,10 @@ from beartype.roar import (
     BeartypeDecorHintPepException,
     BeartypeDecorHintPepUnsupportedException,
 )
-from beartype.typing import Optional
+from beartype.typing import (
+    Dict,
+    Optional,
+)
 from beartype._check.checkmagic import (
     ARG_NAME_GETRANDBITS,
     VAR_NAME_PITH_ROOT,
@@ -36,11 +39,14 @@ from beartype._check.code.codescope import (
     add_func_scope_type_or_types,
     express_func_scope_type_ref,
 )
-from beartype._check.code.snip.codesnipcls import PITH_INDEX_TO_VAR_NAME
+from beartype._check.code.snip.codesnipcls import (
+    HINT_INDEX_TO_HINT_PLACEHOLDER,
+    PITH_INDEX_TO_VAR_NAME,
+)
 from beartype._check.code.snip.codesnipstr import (
     CODE_HINT_CHILD_PLACEHOLDER_PREFIX,
-    CODE_HINT_CHILD_PLACEHOLDER_SUFFIX,
-    CODE_PEP484_INSTANCE_format,
+    CODE_HINT_CHILD_PLACEHOLDER_REGEX,
+    CODE_PEP484_INSTANCE,
     CODE_PEP572_PITH_ASSIGN_EXPR_format,
 )
 from beartype._check.convert.convsanify import (
@@ -71,14 +77,14 @@ from beartype._data.code.pep.datacodepep484585 import (
     CODE_PEP484585_TUPLE_FIXED_LEN_format,
     CODE_PEP484585_TUPLE_FIXED_NONEMPTY_CHILD_format,
     CODE_PEP484585_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format,
-    CODE_PEP484585_TUPLE_FIXED_PREFIX,
-    CODE_PEP484585_TUPLE_FIXED_SUFFIX,
+    CODE_PEP484585_TUPLE_FIXED_PREFIX_format,
+    CODE_PEP484585_TUPLE_FIXED_SUFFIX_format,
 )
 from beartype._data.code.pep.datacodepep484604 import (
     CODE_PEP484604_UNION_CHILD_PEP_format,
     CODE_PEP484604_UNION_CHILD_NONPEP_format,
     CODE_PEP484604_UNION_PREFIX,
-    CODE_PEP484604_UNION_SUFFIX,
+    CODE_PEP484604_UNION_SUFFIX_format,
 )
 from beartype._data.code.pep.datacodepep586 import (
     CODE_PEP586_LITERAL_format,
@@ -98,6 +104,7 @@ from beartype._data.hint.datahinttyping import (
     LexicalScope,
     TypeStack,
 )
+from beartype._data.hint.pep.sign.datapepsigncls import HintSign
 from beartype._data.hint.pep.sign.datapepsigns import (
     HintSignAnnotated,
     HintSignCounter,
@@ -113,19 +120,17 @@ from beartype._data.hint.pep.sign.datapepsignset import (
     HINT_SIGNS_CONTAINER_ARGS_1,
     HINT_SIGNS_MAPPING,
     HINT_SIGNS_ORIGIN_ISINSTANCEABLE,
+    HINT_SIGNS_SUPPORTED,
     HINT_SIGNS_SUPPORTED_DEEP,
     HINT_SIGNS_UNION,
 )
 from beartype._util.cache.utilcachecall import callable_cached
 from beartype._util.cache.pool.utilcachepoollistfixed import (
     FIXED_LIST_SIZE_MEDIUM,
+    FixedList,
     acquire_fixed_list,
     release_fixed_list,
 )
-from beartype._util.cache.pool.utilcachepoolobjecttyped import (
-    acquire_object_typed,
-    release_object_typed,
-)
 from beartype._util.cls.pep.utilpep3119 import (
     die_unless_object_issubclassable,
     is_object_issubclassable,
@@ -147,7 +152,6 @@ from beartype._util.hint.pep.proposal.utilpep593 import (
 )
 from beartype._util.hint.pep.utilpepget import (
     get_hint_pep_args,
-    get_hint_pep_sign,
     get_hint_pep_sign_or_none,
     get_hint_pep_origin_type_isinstanceable,
 )
@@ -157,10 +161,85 @@ from beartype._util.hint.pep.utilpeptest import (
 )
 from beartype._util.hint.utilhinttest import is_hint_ignorable
 from beartype._util.kind.map.utilmapset import update_mapping
-from beartype._util.text.utiltextmunge import replace_str_substrs
 from beartype._util.text.utiltextrepr import represent_object
 from random import getrandbits
 
+# ....................{ PRIVATE ~ globals : kind           }....................
+# Integer constants uniquely identifying each **deep hint kind** (i.e., category
+# of type hints deeply type-checked by a common conditional branch of the
+# breadth-first search (BFS) performed by the make_check_expr() factory).
+_HINT_KIND_UNION = 1
+_HINT_KIND_CONTAINER_ARGS_1 = 2
+_HINT_KIND_TUPLE_FIXED = 3
+_HINT_KIND_MAPPING = 4
+_HINT_KIND_ANNOTATED = 5
+_HINT_KIND_TYPE = 6
+_HINT_KIND_GENERIC = 7
+_HINT_KIND_LITERAL = 8
+
+
+_HINT_SIGN_TO_KIND_DEEP: Dict[HintSign, int] = {
+    HintSignTupleFixed: _HINT_KIND_TUPLE_FIXED,
+    HintSignAnnotated: _HINT_KIND_ANNOTATED,
+    HintSignType: _HINT_KIND_TYPE,
+    HintSignGeneric: _HINT_KIND_GENERIC,
+    HintSignLiteral: _HINT_KIND_LITERAL,
+}
+'''
+Dictionary mapping from each sign deeply type-checked by the breadth-first
+search (BFS) performed by the :func:`.make_check_expr` factory to the integer
+constant uniquely identifying the **deep hint kind** (i.e., conditional branch
+of that BFS) generating code deeply type-checking hints identified by that
+sign.
+
+This dictionary enables that BFS to decide which branch to follow with a single
+dictionary lookup followed by a linear series of integer comparisons rather
+than a linear series of frozen set membership tests.
+'''
+
+
+# Map all signs in each of these frozen sets to the corresponding kind.
+_HINT_SIGN_TO_KIND_DEEP.update(dict.fromkeys(
+    HINT_SIGNS_UNION, _HINT_KIND_UNION))
+_HINT_SIGN_TO_KIND_DEEP.update(dict.fromkeys(
+    HINT_SIGNS_CONTAINER_ARGS_1, _HINT_KIND_CONTAINER_ARGS_1))
+_HINT_SIGN_TO_KIND_DEEP.update(dict.fromkeys(
+    HINT_SIGNS_MAPPING, _HINT_KIND_MAPPING))
+
+# ....................{ PRIVATE ~ globals : origin         }....................
+# Integer constants uniquely identifying each **origin mode** (i.e., condition
+# under which hints originating from isinstanceable origin types are shallowly
+# type-checked as instances of those types by the breadth-first search (BFS)
+# performed by the make_check_expr() factory).
+_HINT_ORIGIN_SHALLOW_ALWAYS = 1
+_HINT_ORIGIN_SHALLOW_IF_UNSUBSCRIPTED = 2
+
+
+_HINT_SIGN_TO_ORIGIN_MODE: Dict[HintSign, int] = {
+    hint_sign: (
+        # If this sign is also deeply type-checked, hints identified by this
+        # sign are shallowly type-checked only if unsubscripted.
+        _HINT_ORIGIN_SHALLOW_IF_UNSUBSCRIPTED
+        if hint_sign in HINT_SIGNS_SUPPORTED_DEEP else
+        # Else, this sign is *NOT* deeply type-checked. In this case, hints
+        # identified by this sign are *ALWAYS* shallowly type-checked.
+        _HINT_ORIGIN_SHALLOW_ALWAYS
+    )
+    for hint_sign in HINT_SIGNS_ORIGIN_ISINSTANCEABLE
+}
+'''
+Dictionary mapping from each sign identifying hints originating from
+isinstanceable origin types to the integer constant uniquely identifying the
+**origin mode** (i.e., condition under which those hints are shallowly
+type-checked as instances of those types) of that sign.
+
+This dictionary enables the :func:`.make_check_expr` factory to decide whether
+to shallowly type-check a hint with a single dictionary lookup rather than two
+frozen set membership tests against the
+:data:`.HINT_SIGNS_ORIGIN_ISINSTANCEABLE` and
+:data:`.HINT_SIGNS_SUPPORTED_DEEP` sets.
+'''
+
 # ....................{ MAKERS                             }....................
 @callable_cached
 def make_check_expr(
@@ -264,6 +343,218 @@ def make_check_expr(
     # this function for similar disambiguity.
     del hint
 
+    # ..................{ FAST PATH                          }..................
+    # Sign uniquely identifying the root hint if this hint is PEP-compliant
+    # *OR* "None" otherwise (i.e., if this hint is PEP-noncompliant).
+    hint_root_sign = get_hint_pep_sign_or_none(hint_root)
+
+    # Isinstanceable type trivially type-checking the root pith if the root hint
+    # is trivially shallowly type-checkable *OR* "None" otherwise.
+    hint_root_type = None
+
+    # Exception prefix prefixing exceptions raised while scoping that type.
+    hint_root_exception_prefix: str = None  # type: ignore[assignment]
+
+    # Origin mode of the root hint if this hint originates from an
+    # isinstanceable origin type *OR* "None" otherwise.
+    hint_root_origin_mode = _HINT_SIGN_TO_ORIGIN_MODE.get(hint_root_sign)
+
+    # If the root hint is a PEP-noncompliant isinstanceable type, this hint
+    # trivially type-checks the root pith as an instance of this type.
+    if hint_root_sign is None:
+        if isinstance(hint_root, type):
+            hint_root_type = hint_root
+            hint_root_exception_prefix = EXCEPTION_PREFIX_HINT
+        # Else, the root hint is neither PEP-compliant *NOR* a type. Defer to
+        # the breadth-first search below to raise an exception.
+    # Else, the root hint is PEP-compliant. In this case, if the root hint both
+    # originates from an origin type *AND* is either unsubscripted *OR*
+    # currently unsupported with deep type-checking, this hint trivially
+    # type-checks the root pith as an instance of this origin type.
+    #
+    # Note that this test exactly mirrors the equivalent test performed by the
+    # "ORIGIN" branch of the breadth-first search below. Since all such signs
+    # are supported, the die_if_hint_pep_unsupported() validator called by
+    # that search need *NOT* be called here.
+    elif hint_root_origin_mode is not None and (
+        hint_root_origin_mode == _HINT_ORIGIN_SHALLOW_ALWAYS or
+        not get_hint_pep_args(hint_root)
+    ):
+        hint_root_type = get_hint_pep_origin_type_isinstanceable(hint_root)
+        hint_root_exception_prefix = EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL
+    # Else, the root hint is non-trivial.
+
+    # If the root hint is trivially shallowly type-checkable, immediately return
+    # code doing so. Doing so avoids the non-trivial setup (e.g., acquisition of
+    # pooled fixed lists, declaration of closures) required by the
+    # breadth-first search below -- which would otherwise visit only this hint.
+    if hint_root_type is not None:
+        # Local scope required by this code.
+        func_wrapper_scope: LexicalScope = {}
+
+        # Return all metadata required by higher-level callers.
+        return (
+            CODE_PEP484_INSTANCE % (
+                VAR_NAME_PITH_ROOT,
+                add_func_scope_type(
+                    cls=hint_root_type,
+                    func_scope=func_wrapper_scope,
+                    exception_prefix=hint_root_exception_prefix,
+                ),
+            ),
+            func_wrapper_scope,
+            (),
+        )
+    # Else, the root hint is non-trivial. In this case, perform a full
+    # breadth-first search over all child hints of this root hint.
+
+    # ..................{ LOCALS ~ hint : metadata           }..................
+    # Parallel fixed lists of all metadata describing all visitable hints
+    # currently discovered by the breadth-first search (BFS) below, such that
+    # the item at the same 0-based index of each of these lists describes the
+    # same hint. Collectively, these lists act as a standard First In First Out
+    # (FIFO) queue, enabling this BFS to be implemented as an efficient
+    # imperative algorithm rather than an inefficient (and dangerous, due to
+    # both unavoidable stack exhaustion and avoidable infinite recursion)
+    # recursive algorithm.
+    #
+    # Note that:
+    # * These metadata are intentionally stored as a "structure of arrays"
+    #   (i.e., one fixed list per metadatum) rather than an "array of
+    #   structures" (i.e., one fixed list of tuples of all metadata). Why?
+    #   Because the latter requires instantiating one new tuple for each
+    #   enqueued hint *AND* unpacking that tuple on dequeueing that hint,
+    #   whereas the former merely requires assigning and accessing list items.
+    # * These lists are guaranteed by the previously called
+    #   _die_if_hint_repr_exceeds_child_limit() function to be larger than the
+    #   number of hints transitively visitable from this root hint. Ergo, *ALL*
+    #   indexation into these lists performed by this BFS is guaranteed to be
+    #   safe. Ergo, avoid explicitly testing below that the
+    #   "hints_meta_index_last" integer maintained by this BFS is strictly less
+    #   than "FIXED_LIST_SIZE_MEDIUM", as this constraint is already guaranteed
+    #   to be the case.
+    #
+    # Fixed list of all visitable hints.
+    hints_meta_hint = acquire_fixed_list(FIXED_LIST_SIZE_MEDIUM)
+
+    # Fixed list of all Python expressions yielding the piths to be
+    # type-checked against these hints.
+    hints_meta_pith_expr = acquire_fixed_list(FIXED_LIST_SIZE_MEDIUM)
+
+    # Fixed list of all integers suffixing the names of the local variables
+    # last assigned by assignment expressions *BEFORE* visiting these hints.
+    hints_meta_pith_var_name_index = acquire_fixed_list(FIXED_LIST_SIZE_MEDIUM)
+
+    # Fixed list of all 1-based indentation levels of code type-checking these
+    # hints.
+    hints_meta_indent_level = acquire_fixed_list(FIXED_LIST_SIZE_MEDIUM)
+
+    # Fixed list of all Python code snippets type-checking these hints, each
+    # possibly embedding one or more placeholder substrings to be subsequently
+    # replaced by the code snippets type-checking the child hints of that hint.
+    hints_meta_code = acquire_fixed_list(FIXED_LIST_SIZE_MEDIUM)
+
+    # ..................{ SEARCH                             }..................
+    # Attempt to generate code type-checking the root pith against the root
+    # hint by performing a breadth-first search over all child hints of that
+    # hint. Release these fixed lists back to their pool even if that search
+    # raises an exception (e.g., due to an invalid child hint), as these lists
+    # would otherwise be permanently leaked from that pool.
+    try:
+        return _make_check_expr_search(
+            hint_root=hint_root,
+            conf=conf,
+            cls_stack=cls_stack,
+            hints_meta_hint=hints_meta_hint,
+            hints_meta_pith_expr=hints_meta_pith_expr,
+            hints_meta_pith_var_name_index=hints_meta_pith_var_name_index,
+            hints_meta_indent_level=hints_meta_indent_level,
+            hints_meta_code=hints_meta_code,
+        )
+    # If that search raised an exception, nullify all object metadata in these
+    # lists *BEFORE* releasing these lists. On success, that search nullifies
+    # only the prefix of these lists it visited; on failure, that search may
+    # have enqueued hints it then failed to visit. Since failure is the uncommon
+    # case, nullifying the entirety of these lists here is acceptable.
+    except:
+        hints_meta_nones = [None] * len(hints_meta_hint)
+        hints_meta_hint[:] = hints_meta_nones
+        hints_meta_pith_expr[:] = hints_meta_nones
+        hints_meta_code[:] = hints_meta_nones
+
+        # Re-raise this exception.
+        raise
+    # Release the fixed lists of all such metadata.
+    finally:
+        release_fixed_list(hints_meta_hint)
+        release_fixed_list(hints_meta_pith_expr)
+        release_fixed_list(hints_meta_pith_var_name_index)
+        release_fixed_list(hints_meta_indent_level)
+        release_fixed_list(hints_meta_code)
+
+# ....................{ PRIVATE ~ makers                   }....................
+def _make_check_expr_search(
+    hint_root: object,
+    conf: BeartypeConf,
+    cls_stack: TypeStack,
+    hints_meta_hint: FixedList,
+    hints_meta_pith_expr: FixedList,
+    hints_meta_pith_var_name_index: FixedList,
+    hints_meta_indent_level: FixedList,
+    hints_meta_code: FixedList,
+) -> CodeGenerated:
+    '''
+    **Type-checking expression breadth-first search** (i.e., low-level callable
+    dynamically generating a pure-Python boolean expression type-checking an
+    arbitrary object against the passed PEP-compliant type hint by performing a
+    breadth-first search (BFS) over all child hints of that hint).
+
+    This searcher is intentionally *not* memoized, as this searcher is only
+    called by the memoized :func:`.make_check_expr` factory. That factory
+    acquires the passed fixed lists *before* calling this searcher and releases
+    those lists *after* this searcher returns or raises an exception.
+
+    Parameters
+    ----------
+    hint_root : object
+        PEP-compliant type hint to be type-checked.
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the passed object).
+    cls_stack : TypeStack
+        **Type stack** (i.e., either a tuple of the one or more
+        :func:`beartype.beartype`-decorated classes lexically containing the
+        class variable or method annotated by this hint *or* :data:`None`).
+    hints_meta_hint : FixedList
+        Fixed list of all visitable hints.
+    hints_meta_pith_expr : FixedList
+        Fixed list of all Python expressions yielding the piths to be
+        type-checked against these hints.
+    hints_meta_pith_var_name_index : FixedList
+        Fixed list of all integers suffixing the names of the local variables
+        last assigned by assignment expressions *before* visiting these hints.
+    hints_meta_indent_level : FixedList
+        Fixed list of all 1-based indentation levels of code type-checking
+        these hints.
+    hints_meta_code : FixedList
+        Fixed list of all Python code snippets type-checking these hints, each
+        possibly embedding one or more placeholder substrings to be
+        subsequently replaced by the code snippets type-checking the child
+        hints of that hint.
+
+    Returns
+    -------
+    CodeGenerated
+        Tuple containing the Python code snippet dynamically generated by this
+        code generator and metadata describing that code. See the
+        :func:`.make_check_expr` factory for details.
+
+    Raises
+    ------
+    BeartypeDecorHintPepException
+        See the :func:`.make_check_expr` factory for details.
+    '''
+
     # ..................{ LOCALS ~ hint : current            }..................
     # Currently visited hint.
     hint_curr = None
@@ -272,17 +563,19 @@ def make_check_expr(
     # "Union" if "hint_curr == Union[int, str]").
     hint_curr_sign = None
 
+    # Integer constant uniquely identifying the deep hint kind of this hint if
+    # this hint is deeply type-checkable *OR* "None" otherwise.
+    hint_curr_kind: Optional[int] = None
+
+    # Integer constant uniquely identifying the origin mode of this hint if
+    # this hint originates from an isinstanceable origin type *OR* "None"
+    # otherwise.
+    hint_curr_origin_mode: Optional[int] = None
+
     # Python expression evaluating to an isinstanceable type (e.g., origin type)
     # associated with the currently visited type hint if any.
     hint_curr_expr: str = None  # type: ignore[assignment]
 
-    # Placeholder string to be globally replaced in the Python code snippet to
-    # be returned (i.e., "func_wrapper_code") by a Python code snippet
-    # type-checking the current pith expression (i.e.,
-    # "pith_curr_var_name") against the currently visited hint (i.e.,
-    # "hint_curr").
-    hint_curr_placeholder = None
-
     # Full Python expression evaluating to the value of the current pith (i.e.,
     # possibly nested object of the passed parameter or return value to be
     # type-checked against the currently visited hint).
@@ -317,51 +610,18 @@ def make_check_expr(
     # (e.g., "(int, str)" if "hint_curr == Union[int, str]").
     hint_childs: tuple = None  # type: ignore[assignment]
 
-    # Current list of all output child hints to replace the Current tuple of all
-    # input child hints subscripting the currently visited hint with.
-    hint_childs_new: list = None  # type: ignore[assignment]
-
     # Number of child hints subscripting the currently visited hint.
     hint_childs_len: int = None  # type: ignore[assignment]
 
-    # 0-based index of the currently iterated child hint of the "hint_childs"
-    # tuple.
-    hint_childs_index: int = None  # type: ignore[assignment]
-
-    # Current tuple of all child child hints subscripting the currently visited
-    # child hint (e.g., "(int, str)" if "hint_child == Union[int, str]").
-    hint_child_childs: tuple = None  # type: ignore[assignment]
-
     # ..................{ LOCALS ~ hint : metadata           }..................
-    # Tuple of metadata describing the currently visited hint, appended by
-    # the previously visited parent hint to the "hints_meta" stack.
-    hint_curr_meta: tuple = None  # type: ignore[assignment]
-
-    # Fixed list of all metadata describing all visitable hints currently
-    # discovered by the breadth-first search (BFS) below. This list acts as a
-    # standard First In First Out (FILO) queue, enabling this BFS to be
-    # implemented as an efficient imperative algorithm rather than an
-    # inefficient (and dangerous, due to both unavoidable stack exhaustion and
-    # avoidable infinite recursion) recursive algorithm.
-    #
-    # Note that this list is guaranteed by the previously called
-    # _die_if_hint_repr_exceeds_child_limit() function to be larger than the
-    # number of hints transitively visitable from this root hint. Ergo, *ALL*
-    # indexation into this list performed by this BFS is guaranteed to be safe.
-    # Ergo, avoid explicitly testing below that the "hints_meta_index_last"
-    # integer maintained by this BFS is strictly less than
-    # "FIXED_LIST_SIZE_MEDIUM", as this constraint is already guaranteed to be
-    # the case.
-    hints_meta = acquire_fixed_list(FIXED_LIST_SIZE_MEDIUM)
-
     # 0-based index of metadata describing the currently visited hint in the
-    # "hints_meta" list.
+    # "hints_meta_*" lists.
     hints_meta_index_curr = 0
 
     # 0-based index of metadata describing the last visitable hint in the
-    # "hints_meta" list, initialized to "-1" to ensure that the initial
+    # "hints_meta_*" lists, initialized to "-1" to ensure that the initial
     # incrementation of this index by the _enqueue_hint_child() directly called
-    # below initializes index 0 of the "hints_meta" fixed list.
+    # below initializes index 0 of the "hints_meta_*" fixed lists.
     #
     # For efficiency, this integer also uniquely identifies the currently
     # iterated child type hint of the currently visited parent type hint.
@@ -369,14 +629,24 @@ def make_check_expr(
 
     # ..................{ LOCALS ~ func : code               }..................
     # Python code snippet type-checking the current pith against the currently
-    # visited hint (to be appended to the "func_wrapper_code" string).
+    # visited hint (to be stored in the "hints_meta_code" list).
     func_curr_code: str = None  # type: ignore[assignment]
 
+    # List of all substrings to be concatenated into the code snippet
+    # type-checking the current pith against the currently visited hint.
+    #
+    # Note that code snippets type-checking an arbitrary number of child hints
+    # (e.g., unions, fixed-length tuples) are intentionally accumulated into
+    # this list and then concatenated exactly once by the str.join() method
+    # rather than iteratively concatenated with the "+=" operator. Whereas the
+    # former is linear in the length of this snippet, the latter is quadratic.
+    func_curr_code_parts: list = None  # type: ignore[assignment]
+
     # ..................{ LOCALS ~ func : code : locals      }..................
     # Local scope (i.e., dictionary mapping from the name to value of each
     # attribute referenced in the signature) of this wrapper function required
     # by this Python code snippet.
-    func_wrapper_scope: LexicalScope = {}
+    func_wrapper_scope = {}
 
     # True only if one or more possibly nested type hints visitable from this
     # root hint require a pseudo-random integer. If true, logic below prefixes
@@ -388,6 +658,10 @@ def make_check_expr(
     # appropriate for the currently visited hint.
     indent_curr: str = None  # type: ignore[assignment]
 
+    # Python code snippet expanding to the current level of indentation
+    # appropriate for the currently iterated child hint.
+    indent_child: str = None  # type: ignore[assignment]
+
     # 1-based indentation level describing the current level of indentation
     # appropriate for the currently visited hint.
     indent_level_curr = 2
@@ -467,16 +741,30 @@ def make_check_expr(
     # local variable assigned the value of this expression.
     pith_curr_assign_expr: str = None  # type: ignore[assignment]
 
+    # Python expression yielding the value of the current pith in the next test
+    # generated for the currently visited hint (e.g., either
+    # "pith_curr_assign_expr" for the first such test *OR*
+    # "pith_curr_var_name" for all subsequent such tests).
+    pith_curr_expr_next: str = None  # type: ignore[assignment]
+
     # ..................{ CLOSURES                           }..................
     # Closures centralizing frequently repeated logic, addressing Don't Repeat
     # Yourself (DRY) concerns during the breadth-first search (BFS) below.
 
     def _enqueue_hint_child(pith_child_expr: str) -> str:
         '''
-        **Enqueue** (i.e., append) a new tuple of metadata describing the
-        currently iterated child type hint to the end of the ``hints_meta``
-        queue, enabling this hint to be visited by the ongoing breadth-first
-        search (BFS) traversing over this queue.
+        **Enqueue** (i.e., append) all metadata describing the currently
+        iterated child type hint to the end of the parallel ``hints_meta_*``
+        queues, enabling this hint to be visited by the ongoing breadth-first
+        search (BFS) traversing over these queues.
+
+        If this child type hint is a PEP-noncompliant isinstanceable type (e.g.,
+        :class:`int`, :class:`str`), this closure instead avoids enqueueing
+        this hint. Such a hint is necessarily a leaf of the graph traversed by
+        this BFS, whose type-checking code is a trivial :func:`isinstance` call.
+        Enqueueing this hint would thus needlessly incur the full cost of a BFS
+        iteration merely to generate that call, which this closure instead
+        generates and returns directly.
 
         Parameters
         ----------
@@ -494,57 +782,75 @@ def make_check_expr(
         Returns
         -------
         str
-            Placeholder string to be subsequently replaced by code type-checking
-            this child pith against this child type hint.
+            Either:
+
+            * If this child type hint is a PEP-noncompliant isinstanceable
+              type, code type-checking this child pith against this type.
+            * Else, placeholder string to be subsequently replaced by code
+              type-checking this child pith against this child type hint.
         '''
         # print(f'pith_child_expr: {pith_child_expr}')
 
         # Allow these local variables of the outer scope to be modified below.
         nonlocal hints_meta_index_last
 
+        # If this child hint is a PEP-noncompliant isinstanceable type, return
+        # code trivially type-checking this child pith against this type.
+        #
+        # Note that:
+        # * This test is intentionally ordered such that the faster
+        #   isinstance() builtin is called *BEFORE* the slower is_hint_pep()
+        #   tester, which is then only called on the uncommon case of this
+        #   hint being a type. Since a type may also be PEP-compliant (e.g., a
+        #   user-defined generic), the latter test remains necessary.
+        # * This test is intentionally performed *AFTER* testing whether this
+        #   hint is a type, as many PEP-compliant hints originate from
+        #   PEP-noncompliant types (e.g., "List[int]" from "list"). Testing
+        #   for PEP-compliance here ensures we defer to the BFS below to
+        #   generate non-trivial code deeply type-checking these hints instead
+        #   of trivial code only shallowly type-checking those types.
+        # * This code contains *NO* "{" or "}" characters and is thus safely
+        #   embeddable in parent code subsequently formatted by str.format().
+        if isinstance(hint_child, type) and not is_hint_pep(hint_child):
+            return CODE_PEP484_INSTANCE % (
+                pith_child_expr,
+                add_func_scope_type(
+                    cls=hint_child,
+                    func_scope=func_wrapper_scope,
+                    exception_prefix=EXCEPTION_PREFIX_HINT,
+                ),
+            )
+        # Else, this child hint is either PEP-compliant or *NOT* a type. In
+        # either case, this child hint is non-trivial and thus enqueued.
+
         # Increment both the 0-based index of metadata describing the last
-        # visitable hint in the "hints_meta" list and the unique identifier of
-        # the currently iterated child hint *BEFORE* overwriting the existing
+        # visitable hint in the "hints_meta_*" lists and the unique identifier
+        # of the currently iterated child hint *BEFORE* overwriting the existing
         # metadata at this index.
         #
         # Note this index is guaranteed to *NOT* exceed the fixed length of
-        # this list, by prior validation.
+        # these lists, by prior validation.
         hints_meta_index_last += 1
 
-        # Placeholder string to be globally replaced by code type-checking the
-        # child pith against this child hint, intentionally prefixed and
-        # suffixed by characters that:
-        #
-        # * Are intentionally invalid as Python code, guaranteeing that the
-        #   top-level call to the exec() builtin performed by the @beartype
-        #   decorator will raise a "SyntaxError" exception if the caller fails
-        #   to replace all placeholder substrings generated by this method.
-        # * Protect the identifier embedded in this substring against ambiguous
-        #   global replacements of larger identifiers containing this
-        #   identifier. If this identifier were *NOT* protected in this manner,
-        #   then the first substring "0" generated by this method would
-        #   ambiguously overlap with the subsequent substring "10" generated by
-        #   this method, which would then produce catastrophically erroneous
-        #   and undebuggable Python code.
-        hint_child_placeholder = (
-            f'{CODE_HINT_CHILD_PLACEHOLDER_PREFIX}'
-            f'{str(hints_meta_index_last)}'
-            f'{CODE_HINT_CHILD_PLACEHOLDER_SUFFIX}'
-        )
+        # Placeholder string to be subsequently replaced by code type-checking
+        # the child pith against this child hint, efficiently retrieved from a
+        # global cache of such placeholders rather than inefficiently
+        # reformatted on each call. See the "HintIndexToHintPlaceholder" class
+        # for further details.
+        hint_child_placeholder = HINT_INDEX_TO_HINT_PLACEHOLDER[
+            hints_meta_index_last]
 
-        # Create and insert a new tuple of metadata describing this child hint
-        # at this index of this list.
+        # Insert all metadata describing this child hint at this index of these
+        # lists.
         #
-        # Note that this assignment is guaranteed to be safe, as
+        # Note that these assignments are guaranteed to be safe, as
         # "FIXED_LIST_SIZE_MEDIUM" is guaranteed to be substantially larger than
         # "hints_meta_index_last".
-        hints_meta[hints_meta_index_last] = (
-            hint_child,
-            hint_child_placeholder,
-            pith_child_expr,
-            pith_curr_var_name_index,
-            indent_level_child,
-        )
+        hints_meta_hint[hints_meta_index_last] = hint_child
+        hints_meta_pith_expr[hints_meta_index_last] = pith_child_expr
+        hints_meta_pith_var_name_index[hints_meta_index_last] = (
+            pith_curr_var_name_index)
+        hints_meta_indent_level[hints_meta_index_last] = indent_level_child
 
         # Return this placeholder string.
         return hint_child_placeholder
@@ -553,49 +859,21 @@ def make_check_expr(
     # Local variables calling one or more closures declared above and thus
     # deferred until after declaring those closures.
 
-    # Placeholder string to be globally replaced in the Python code snippet to
-    # be returned (i.e., "func_wrapper_code") by a Python code snippet
-    # type-checking the child pith expression (i.e., "pith_child_expr") against
-    # the currently iterated child hint (i.e., "hint_child"), initialized to a
-    # placeholder describing the root hint.
-    hint_child_placeholder = _enqueue_hint_child(VAR_NAME_PITH_ROOT)
-
-    # Python code snippet type-checking the root pith against the root hint,
-    # localized separately from the "func_wrapper_code" snippet to enable this
-    # function to validate this code to be valid *BEFORE* returning this code.
-    func_root_code = hint_child_placeholder
-
-    # Python code snippet to be returned, seeded with a placeholder to be
-    # replaced on the first iteration of the breadth-first search performed
-    # below with a snippet type-checking the root pith against the root hint.
-    #
-    # Note that, shockingly, brute-force string concatenation has been
-    # personally profiled by @leycec to be substantially faster than *ALL*
-    # alternatives under CPython up to a large number of iterations (e.g.,
-    # 100,000). This includes these popular alternatives, *ALL* of which are
-    # orders of magnitude slower than brute-force string concatenation:
-    # * deque.append().
-    # * list.append().
-    func_wrapper_code = func_root_code
+    # Enqueue the root hint as the first hint to be visited by the
+    # breadth-first search performed below. Since the root hint is guaranteed
+    # by the fast path above to *NOT* be a PEP-noncompliant isinstanceable type,
+    # this call is guaranteed to return a placeholder string rather than code.
+    # Since the code snippet type-checking the root pith against the root hint
+    # is unconditionally stored at index 0 of the "hints_meta_code" list by
+    # that search, this placeholder string is safely ignorable.
+    _enqueue_hint_child(VAR_NAME_PITH_ROOT)
 
     # ..................{ SEARCH                             }..................
     # While the 0-based index of metadata describing the next visited hint in
-    # the "hints_meta" list does *NOT* exceed that describing the last
-    # visitable hint in this list, there remains at least one hint to be
+    # the "hints_meta_*" lists does *NOT* exceed that describing the last
+    # visitable hint in these lists, there remains at least one hint to be
     # visited in the breadth-first search performed by this iteration.
     while hints_meta_index_curr <= hints_meta_index_last:
-        # Metadata describing the currently visited hint.
-        hint_curr_meta = hints_meta[hints_meta_index_curr]
-
-        # Assert this metadata is a tuple as expected. This enables us to
-        # distinguish between proper access of used items and improper access
-        # of unused items of the parent fixed list containing this tuple, since
-        # an unused item of this list is initialized to "None" by default.
-        assert hint_curr_meta.__class__ is tuple, (
-            f'Current hint metadata {repr(hint_curr_meta)} at '
-            f'index {hints_meta_index_curr} not tuple.'
-        )
-
         #FIXME: ...heh. It's time, people. Sadly, it turns out that redefining
         #the _enqueue_hint() closure on *EVERY* call to this function is a huge
         #time sink -- far huger than anything else, actually. Therefore:
@@ -609,41 +887,38 @@ def make_check_expr(
         #* Remove all of the following locals from this function in favour of
         #  the "HintMeta" slotted fields of the same names:
         #  * hint_curr.
-        #  * hint_curr_placeholder.
         #  * pith_curr_expr.
         #  * pith_curr_var_name_index.
         #  * indent_level_curr.
 
-        # Localize metadata for both efficiency and f-string purposes.
-        #
-        # Note that list unpacking is substantially more efficient than
-        # manually indexing list items. The former requires only a single Python
-        # statement, whereas the latter requires "n" Python statements.
-        (
-            hint_curr,
-            hint_curr_placeholder,
-            pith_curr_expr,
-            pith_curr_var_name_index,
-            indent_level_curr,
-        ) = hint_curr_meta
+        # Localize metadata describing the currently visited hint for both
+        # efficiency and f-string purposes.
+        hint_curr = hints_meta_hint[hints_meta_index_curr]
+        pith_curr_expr = hints_meta_pith_expr[hints_meta_index_curr]
+        pith_curr_var_name_index = hints_meta_pith_var_name_index[
+            hints_meta_index_curr]
+        indent_level_curr = hints_meta_indent_level[hints_meta_index_curr]
         # print(f'Visiting type hint {repr(hint_curr)}...')
 
-        #FIXME: Comment this sanity check out after we're sufficiently
-        #convinced this algorithm behaves as expected. While useful, this check
-        #requires a linear search over the entire code and is thus costly.
-        # assert hint_curr_placeholder in func_wrapper_code, (
-        #     '{} {!r} placeholder {} not found in wrapper body:\n{}'.format(
-        #         hint_curr_exception_prefix, hint, hint_curr_placeholder, func_wrapper_code))
-
         # Code snippet type-checking the current pith against the current hint.
         func_curr_code = None  # type: ignore[assignment]
 
         # Code expression evaluating to the origin type of the current hint.
         hint_curr_expr = None  # type: ignore[assignment]
 
+        # Sign uniquely identifying this hint if this hint is PEP-compliant
+        # *OR* "None" otherwise (i.e., if this hint is PEP-noncompliant).
+        #
+        # Note that this sign is intentionally retrieved exactly once here and
+        # then reused by *ALL* tests below -- including tests that the
+        # higher-level is_hint_pep() tester, die_if_hint_pep_unsupported()
+        # validator, and get_hint_pep_sign() getter would otherwise each
+        # perform by redundantly retrieving this same sign.
+        hint_curr_sign = get_hint_pep_sign_or_none(hint_curr)
+
         # ................{ PEP                                }................
         # If this hint is PEP-compliant...
-        if is_hint_pep(hint_curr):
+        if hint_curr_sign is not None:
             #FIXME: Refactor to call warn_if_hint_pep_unsupported() instead.
             #Actually...wait. This is probably still a valid test here. We'll
             #need to instead augment the is_hint_ignorable() function to
@@ -661,13 +936,21 @@ def make_check_expr(
 
             # If this hint is currently unsupported, raise an exception.
             #
-            # Note the human-readable label prefixing the representations of
-            # child PEP-compliant type hints is unconditionally passed. Since
-            # the root hint has already been validated to be supported by
-            # the above call to the same function, this call is guaranteed to
-            # *NEVER* raise an exception for that hint.
-            die_if_hint_pep_unsupported(
-                hint=hint_curr, exception_prefix=EXCEPTION_PREFIX)
+            # Note that:
+            # * The human-readable label prefixing the representations of
+            #   child PEP-compliant type hints is unconditionally passed. Since
+            #   the root hint has already been validated to be supported by
+            #   the above call to the same function, this call is guaranteed
+            #   to *NEVER* raise an exception for that hint.
+            # * The die_if_hint_pep_unsupported() validator is only called
+            #   when this sign is unsupported. Since that validator internally
+            #   reduces to the same test against this same sign in the common
+            #   case that this hint is supported, calling that validator
+            #   unconditionally would needlessly incur the cost of several
+            #   redundant function calls for each visited hint.
+            if hint_curr_sign not in HINT_SIGNS_SUPPORTED:
+                die_if_hint_pep_unsupported(
+                    hint=hint_curr, exception_prefix=EXCEPTION_PREFIX)
             # Else, this hint is supported.
 
             # Assert that this hint is unignorable. Iteration below generating
@@ -681,8 +964,6 @@ def make_check_expr(
                 f'{repr(hint_curr)} not ignored.'
             )
 
-            # Sign uniquely identifying this hint.
-            hint_curr_sign = get_hint_pep_sign(hint_curr)
             # print(f'Visiting PEP type hint {repr(hint_curr)} sign {repr(hint_curr_sign)}...')
 
             #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
@@ -747,6 +1028,13 @@ def make_check_expr(
             #   a substantial up-front performance cost of redeclaring these
             #   closures on each invocation of this function.
             #
+            # Instead, deep type-checking logic below reduces this sign to the
+            # integer constant identifying its deep hint kind with a single
+            # lookup of the "_HINT_SIGN_TO_KIND_DEEP" dictionary *BEFORE*
+            # switching on that integer. Doing so preserves the above inline
+            # branches while reducing each test to a trivial integer comparison
+            # rather than a (possibly) less trivial frozen set membership test.
+            #
             # ..............{ SHALLOW                            }..............
             # Perform shallow type-checking logic (i.e., logic that does *NOT*
             # recurse and thus "bottoms out" at this hint) *BEFORE* deep
@@ -762,15 +1050,40 @@ def make_check_expr(
             #   "pith_curr_expr" accesses this pith extremely inefficiently.
             #
             # ..............{ ORIGIN                             }..............
+            # Origin mode of this sign if this hint originates from an
+            # isinstanceable origin type *OR* "None" otherwise.
+            hint_curr_origin_mode = _HINT_SIGN_TO_ORIGIN_MODE.get(
+                hint_curr_sign)
+
+            # If this hint is shallowly type-checkable only when unsubscripted,
+            # obtain the tuple of all arguments subscripting this hint if any
+            # *OR* the empty tuple otherwise (e.g., if this hint is its own
+            # unsubscripted "typing" attribute).
+            #
+            # Note that:
+            # * The "__args__" dunder attribute is *NOT* guaranteed to exist
+            #   for arbitrary PEP-compliant type hints. Ergo, we obtain this
+            #   attribute via a higher-level utility getter instead.
+            # * This tuple is intentionally obtained here *ONLY* for hints whose
+            #   shallow test below requires this tuple. All other hints either
+            #   never require this tuple (e.g., forward references, hints that
+            #   are always shallowly type-checked) *OR* obtain this tuple below
+            #   on deeply type-checking this hint. Either way, this tuple is
+            #   obtained at most once for each visited hint.
+            if hint_curr_origin_mode == _HINT_ORIGIN_SHALLOW_IF_UNSUBSCRIPTED:
+                hint_childs = get_hint_pep_args(hint_curr)
+            # Else, this hint is *NOT* shallowly type-checkable only when
+            # unsubscripted.
+
             # If this hint both...
             if (
                 # Originates from an origin type and may thus be shallowly
                 # type-checked against that type *AND is either...
-                hint_curr_sign in HINT_SIGNS_ORIGIN_ISINSTANCEABLE and (
-                    # Unsubscripted *OR*...
-                    not get_hint_pep_args(hint_curr) or
-                    # Currently unsupported with deep type-checking...
-                    hint_curr_sign not in HINT_SIGNS_SUPPORTED_DEEP
+                hint_curr_origin_mode is not None and (
+                    # Currently unsupported with deep type-checking *OR*...
+                    hint_curr_origin_mode == _HINT_ORIGIN_SHALLOW_ALWAYS or
+                    # Unsubscripted...
+                    not hint_childs
                 )
             ):
             # Then generate trivial code shallowly type-checking the current
@@ -779,10 +1092,10 @@ def make_check_expr(
                 # print(f'Shallow checking unsubscripted hint {repr(hint_curr)}...')
 
                 # Code type-checking the current pith against this origin type.
-                func_curr_code = CODE_PEP484_INSTANCE_format(
-                    pith_curr_expr=pith_curr_expr,
+                func_curr_code = CODE_PEP484_INSTANCE % (
+                    pith_curr_expr,
                     # Python expression evaluating to this origin type.
-                    hint_curr_expr=add_func_scope_type(
+                    add_func_scope_type(
                         # Origin type of this hint if any *OR* raise an
                         # exception -- which should *NEVER* happen, as this hint
                         # was validated above to be supported.
@@ -819,9 +1132,9 @@ def make_check_expr(
                 )
 
                 # Code type-checking the current pith against this class.
-                func_curr_code = CODE_PEP484_INSTANCE_format(
-                    pith_curr_expr=pith_curr_expr,
-                    hint_curr_expr=hint_curr_expr,
+                func_curr_code = CODE_PEP484_INSTANCE % (
+                    pith_curr_expr,
+                    hint_curr_expr,
                 )
             # Else, this hint is *NOT* a forward reference.
             #
@@ -832,17 +1145,19 @@ def make_check_expr(
             # Perform deep type-checking logic (i.e., logic that is guaranteed
             # to recurse and thus *NOT* "bottom out" at this hint).
             else:
-                # Tuple of all arguments subscripting this hint if any *OR* the
-                # empty tuple otherwise (e.g., if this hint is its own
-                # unsubscripted "typing" attribute).
-                #
-                # Note that the "__args__" dunder attribute is *NOT* guaranteed
-                # to exist for arbitrary PEP-compliant type hints. Ergo, we
-                # obtain this attribute via a higher-level utility getter
-                # instead.
-                hint_childs = get_hint_pep_args(hint_curr)
+                # If the tuple of all arguments subscripting this hint was *NOT*
+                # obtained above, do so now.
+                if hint_curr_origin_mode is None:
+                    hint_childs = get_hint_pep_args(hint_curr)
+                # Else, this tuple was obtained above.
+
+                # Number of arguments subscripting this hint.
                 hint_childs_len = len(hint_childs)
 
+                # Integer constant uniquely identifying the deep hint kind of
+                # this hint if this hint is deeply type-checkable *OR* "None".
+                hint_curr_kind = _HINT_SIGN_TO_KIND_DEEP.get(hint_curr_sign)
+
                 # Python code snippet expanding to the current level of
                 # indentation appropriate for the current hint.
                 indent_curr = INDENT_LEVEL_TO_CODE[indent_level_curr]
@@ -851,6 +1166,177 @@ def make_check_expr(
                 # indentation appropriate for the currently iterated child hint.
                 indent_level_child = indent_level_curr + 1
 
+                # ............{ DEEP ~ union : partition            }............
+                # If this hint is a union, partition the child hints subscripting
+                # this union *BEFORE* deciding below whether to assign the
+                # current pith to a local variable. Doing so enables that
+                # decision to account for unions reduced to only one child hint,
+                # which then type-check the current pith against only that child
+                # hint and thus never reuse that local variable.
+                if hint_curr_kind == _HINT_KIND_UNION:
+                    # Assert this union to be subscripted by one or more child
+                    # hints. Note this should *ALWAYS* be the case, as:
+                    # * The unsubscripted "typing.Union" object is explicitly
+                    #   listed in the "HINTS_REPR_IGNORABLE_SHALLOW" set and
+                    #   should thus have already been ignored when present.
+                    # * The "typing" module explicitly prohibits empty union
+                    #   subscription: e.g.,
+                    #       >>> typing.Union[]
+                    #       SyntaxError: invalid syntax
+                    #       >>> typing.Union[()]
+                    #       TypeError: Cannot take a Union of no types.
+                    assert hint_childs, (
+                        f'{EXCEPTION_PREFIX}union type hint '
+                        f'{repr(hint_curr)} unsubscripted.'
+                    )
+                    # Else, this union is subscripted by two or more arguments.
+                    # Why two rather than one? Because the "typing" module
+                    # reduces unions of one argument to that argument: e.g.,
+                    #     >>> import typing
+                    #     >>> typing.Union[int]
+                    #     int
+
+                    # Create the following:
+                    # * "hint_childs_nonpep", the ordered set of all
+                    #   PEP-noncompliant child hints subscripting this union.
+                    # * "hint_childs_pep", the ordered set of all PEP-compliant
+                    #   child hints subscripting this union.
+                    #
+                    # Since these child hints require fundamentally different
+                    # forms of type-checking, prefiltering child hints into
+                    # these sets *BEFORE* generating code type-checking these
+                    # child hints improves both efficiency and maintainability.
+                    #
+                    # Note that these sets are intentionally dictionaries whose
+                    # keys are these child hints and whose values are ignored
+                    # rather than actual sets. Why? Because dictionaries both
+                    # deduplicate *AND* preserve insertion order, whereas sets
+                    # only deduplicate. Preserving the order in which child
+                    # hints subscript this union guarantees that the code
+                    # generated for this union is deterministic across Python
+                    # processes (which otherwise randomize hashing) and thus
+                    # both reproducible *AND* type-checks child hints in the
+                    # order expected by users.
+                    #
+                    # Note that these dictionaries are intentionally created
+                    # as empty dictionary literals rather than acquired from
+                    # (and later released back to) the object pool via the
+                    # acquire_object_typed() and release_object_typed()
+                    # functions. For small containers like these, a dictionary
+                    # literal compiles to a single opcode and is thus faster
+                    # than the multiple function calls required to acquire,
+                    # clear, and release pooled dictionaries.
+                    hint_childs_nonpep = {}
+                    hint_childs_pep = {}
+
+                    # For each subscripted argument of this union...
+                    #
+                    # Note that this iteration both flattens *ALL* child unions
+                    # nested in this parent union *AND* filters *ALL* child
+                    # hints into the above sets in a single pass. Since the
+                    # sign of each child hint is already required to detect
+                    # nested child unions, that sign is then trivially reused
+                    # to decide whether that child hint is PEP-compliant
+                    # *WITHOUT* redundantly recomputing that sign via the
+                    # is_hint_pep() tester in a subsequent iteration.
+                    #
+                    # Note that this iteration does *NOT* recursively flatten
+                    # arbitrarily nested child unions regardless of nesting
+                    # depth in this parent union. Doing so is non-trivial and
+                    # currently *NOT* required by any existing edge cases.
+                    for hint_child in hint_childs:
+                        # This child hint sanified (i.e., sanitized) from this
+                        # child hint if this child hint is reducible *OR*
+                        # preserved as is otherwise (i.e., if this child hint is
+                        # irreducible).
+                        #
+                        # Note that:
+                        # * This sanification is intentionally performed
+                        #   *BEFORE* this child hint is tested as being either
+                        #   PEP-compliant or -noncompliant. Why? Because a small
+                        #   subset of low-level reduction routines performed by
+                        #   this high-level sanification actually expand a
+                        #   PEP-noncompliant type into a PEP-compliant type
+                        #   hint. This includes:
+                        #   * The PEP-noncompliant "float' and "complex" types,
+                        #     implicitly expanded to the PEP 484-compliant
+                        #     "float | int" and "complex | float | int" type
+                        #     hints (respectively) when the non-default
+                        #     "conf.is_pep484_tower=True" parameter is enabled.
+                        # * This sanification intentionally calls the
+                        #   lower-level sanify_hint_child() rather than the
+                        #   higher-level
+                        #   sanify_hint_child_if_unignorable_or_none() sanifier.
+                        #   Technically, the latter would suffice as well.
+                        #   Pragmatically, both are semantically equivalent here
+                        #   but the former is faster. Why? By definition, this
+                        #   union is unignorable. If this union were ignorable,
+                        #   the parent hint containing this union would already
+                        #   have ignored this union. Moreover, *ALL* child
+                        #   hints subscripting an unignorable union are
+                        #   necessarily also unignorable. It follows that this
+                        #   child hint need *NOT* be tested for ignorability.
+                        # print(f'Sanifying union child hint {repr(hint_child)} under {repr(conf)}...')
+                        hint_child = sanify_hint_child(
+                            hint=hint_child,
+                            conf=conf,
+                            cls_stack=cls_stack,
+                            exception_prefix=EXCEPTION_PREFIX,
+                        )
+                        # print(f'Sanified union child hint to {repr(hint_child)}...')
+
+                        # Sign of this sanified child hint if this hint is
+                        # PEP-compliant *OR* "None" otherwise (i.e., if this
+                        # hint is PEP-noncompliant).
+                        hint_child_sign = get_hint_pep_sign_or_none(hint_child)
+
+                        # If this child hint is PEP-noncompliant, filter this
+                        # child hint into the set of PEP-noncompliant child
+                        # hints.
+                        if hint_child_sign is None:
+                            hint_childs_nonpep[hint_child] = None
+                        # Else, this child hint is PEP-compliant.
+                        #
+                        # If this child hint is itself a child union nested in
+                        # this parent union, explicitly flatten this nested
+                        # union by filtering *ALL* child child hints
+                        # subscripting this child union into these sets.
+                        #
+                        # Note that this edge case currently *ONLY* arises when
+                        # this child hint has been expanded by the above call to
+                        # the sanify_hint_child() function from a non-union (e.g.,
+                        # "float") into a union (e.g., "float | int"). The
+                        # standard PEP 484-compliant "typing.Union" factory
+                        # already implicitly flattens nested unions: e.g.,
+                        #     >>> from typing import Union
+                        #     >>> Union[float, Union[int, str]]
+                        #     typing.Union[float, int, str]
+                        elif hint_child_sign in HINT_SIGNS_UNION:
+                            # print(f'Expanding union {repr(hint_curr)} with child union {repr(hint_child)}...')
+                            # For each child child hint subscripting this child
+                            # union, filter this child child hint into the
+                            # appropriate set.
+                            for hint_child in get_hint_pep_args(hint_child):
+                                if is_hint_pep(hint_child):
+                                    hint_childs_pep[hint_child] = None
+                                else:
+                                    hint_childs_nonpep[hint_child] = None
+                        # Else, this child hint is *NOT* itself a union. In this
+                        # case, filter this child hint into the set of
+                        # PEP-compliant child hints.
+                        #
+                        # Note that this PEP-compliant child hint *CANNOT* also
+                        # be filtered into the set of PEP-noncompliant child
+                        # hints, even if this child hint originates from a
+                        # non-"typing" type (e.g., "List[int]" from "list").
+                        # Why? Because that would then induce false positives
+                        # when the current pith shallowly satisfies this
+                        # non-"typing" type but does *NOT* deeply satisfy this
+                        # child hint.
+                        else:
+                            hint_childs_pep[hint_child] = None
+                # Else, this hint is *NOT* a union.
+
                 # ............{ DEEP ~ expression                  }............
                 #FIXME: Unit test that this is behaving as expected. Doing so
                 #will require further generalizations, including:
@@ -995,7 +1481,18 @@ def make_check_expr(
                     # As of this writing, the only such edge case is a PEP 484-
                     # or 604-compliant union containing *ONLY* two or more
                     # PEP-compliant type hints (e.g., "list[str] | set[bytes]").
-                    ':=' in pith_curr_expr
+                    ':=' in pith_curr_expr or
+                    # A union subscripted by only one child hint after
+                    # sanifying, flattening, and deduplicating these hints.
+                    # Since this union is semantically equivalent to that child
+                    # hint, the code type-checking this union is that of that
+                    # child hint. Allocating a local variable here would
+                    # needlessly consume the next local variable name, which
+                    # that child hint would then be unable to reuse.
+                    (
+                        hint_curr_kind == _HINT_KIND_UNION and
+                        len(hint_childs_nonpep) + len(hint_childs_pep) == 1
+                    )
                 ):
                     # Then the current pith is safely assignable to a unique
                     # local variable via an assignment expression.
@@ -1064,317 +1561,192 @@ def make_check_expr(
                 # assignment expressions. This differs from "typing"
                 # pseudo-containers, which narrow the current pith expression
                 # and thus do benefit from assignment expressions.
-                if hint_curr_sign in HINT_SIGNS_UNION:
-                    # Assert this union to be subscripted by one or more child
-                    # hints. Note this should *ALWAYS* be the case, as:
-                    # * The unsubscripted "typing.Union" object is explicitly
-                    #   listed in the "HINTS_REPR_IGNORABLE_SHALLOW" set and
-                    #   should thus have already been ignored when present.
-                    # * The "typing" module explicitly prohibits empty union
-                    #   subscription: e.g.,
-                    #       >>> typing.Union[]
-                    #       SyntaxError: invalid syntax
-                    #       >>> typing.Union[()]
-                    #       TypeError: Cannot take a Union of no types.
-                    assert hint_childs, (
-                        f'{EXCEPTION_PREFIX}union type hint '
-                        f'{repr(hint_curr)} unsubscripted.'
-                    )
-                    # Else, this union is subscripted by two or more arguments.
-                    # Why two rather than one? Because the "typing" module
-                    # reduces unions of one argument to that argument: e.g.,
-                    #     >>> import typing
-                    #     >>> typing.Union[int]
-                    #     int
-
-                    # 0-based index of the currently iterated child hint.
-                    hint_childs_index = 0
-
-                    # For efficiency, reuse a previously created list of all
-                    # new child hints of this parent union.
-                    hint_childs_new = acquire_object_typed(list)
-                    hint_childs_new.clear()
-
-                    # For each subscripted argument of this union...
+                #
+                # Note that the deep hint kind of this hint is guaranteed to be
+                # non-"None". If this hint were *NOT* deeply type-checkable,
+                # this hint would have been shallowly type-checked above.
+                if hint_curr_kind == _HINT_KIND_UNION:
+                    # If this union is subscripted by only one child hint after
+                    # sanifying, flattening, and deduplicating these hints, this
+                    # union is semantically equivalent to that child hint. In
+                    # this case, generate code type-checking the current pith
+                    # against only that child hint rather than embedding that
+                    # code in the boolean "or" expression generated below.
                     #
-                    # Note that this preliminary iteration:
-                    # * Modifies the "hint_childs" container being iterated over
-                    #   and is thus intentionally implemented as a cumbersome
-                    #   "while" loop rather than a convenient "for" loop.
-                    # * Exists for the sole purpose of explicitly flattening
-                    #   *ALL* child unions nested in this parent union. This
-                    #   iteration *CANNOT* be efficiently combined with the
-                    #   iteration performed below for that reason.
-                    # * Does *NOT* recursively flatten arbitrarily nested
-                    #   child unions regardless of nesting depth in this parent
-                    #   union. Doing so is non-trivial and currently *NOT*
-                    #   required by any existing edge cases. "Huzzah!"
-                    while hint_childs_index < hint_childs_len:
-                        # Current child hint of this union.
-                        hint_child = hint_childs[hint_childs_index]
-
-                        # This child hint sanified (i.e., sanitized) from this
-                        # child hint if this child hint is reducible *OR*
-                        # preserved as is otherwise (i.e., if this child hint is
-                        # irreducible).
-                        #
-                        # Note that:
-                        # * This sanification is intentionally performed
-                        #   *BEFORE* this child hint is tested as being either
-                        #   PEP-compliant or -noncompliant. Why? Because a small
-                        #   subset of low-level reduction routines performed by
-                        #   this high-level sanification actually expand a
-                        #   PEP-noncompliant type into a PEP-compliant type
-                        #   hint. This includes:
-                        #   * The PEP-noncompliant "float' and "complex" types,
-                        #     implicitly expanded to the PEP 484-compliant
-                        #     "float | int" and "complex | float | int" type
-                        #     hints (respectively) when the non-default
-                        #     "conf.is_pep484_tower=True" parameter is enabled.
-                        # * This sanification intentionally calls the
-                        #   lower-level sanify_hint_child() rather than the
-                        #   higher-level
-                        #   sanify_hint_child_if_unignorable_or_none() sanifier.
-                        #   Technically, the latter would suffice as well.
-                        #   Pragmatically, both are semantically equivalent here
-                        #   but the former is faster. Why? By definition, this
-                        #   union is unignorable. If this union were ignorable,
-                        #   the parent hint containing this union would already
-                        #   have ignored this union. Moreover, *ALL* child
-                        #   hints subscripting an unignorable union are
-                        #   necessarily also unignorable. It follows that this
-                        #   child hint need *NOT* be tested for ignorability.
-                        # print(f'Sanifying union child hint {repr(hint_child)} under {repr(conf)}...')
-                        hint_child = sanify_hint_child(
-                            hint=hint_child,
-                            conf=conf,
-                            cls_stack=cls_stack,
-                            exception_prefix=EXCEPTION_PREFIX,
+                    # Note that the "typing" module forces unions to be
+                    # subscripted by two or more child hints. Nonetheless, this
+                    # edge case commonly arises when two or more of those child
+                    # hints reduce to the same hint (e.g., "Union[int, UserId]"
+                    # where "UserId = NewType('UserId', int)").
+                    #
+                    # If this union is subscripted by only one PEP-noncompliant
+                    # child hint, generate code trivially type-checking the
+                    # current pith against that type.
+                    #
+                    # Note that this exception prefix intentionally matches that
+                    # passed to the add_func_scope_types() function below for
+                    # the PEP-noncompliant child hints of unions subscripted by
+                    # two or more child hints, ensuring that exceptions raised
+                    # for an invalid child type read the same either way.
+                    if not hint_childs_pep and len(hint_childs_nonpep) == 1:
+                        func_curr_code = CODE_PEP484_INSTANCE % (
+                            pith_curr_expr,
+                            add_func_scope_type(
+                                cls=next(iter(hint_childs_nonpep)),
+                                func_scope=func_wrapper_scope,
+                                exception_prefix=(
+                                    EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                            ),
+                        )
+                    # Else, this union is subscripted by either PEP-compliant
+                    # child hints *OR* two or more PEP-noncompliant child hints.
+                    #
+                    # If this union is subscripted by only one PEP-compliant
+                    # child hint, defer to the code deeply type-checking the
+                    # current pith against that child hint.
+                    #
+                    # Note that this child hint is enqueued at the indentation
+                    # level of this union rather than one level deeper. Since
+                    # the code type-checking this child hint replaces rather
+                    # than nests inside the code type-checking this union, that
+                    # code is then indented exactly as if this child hint were
+                    # visited in place of this union.
+                    elif not hint_childs_nonpep and len(hint_childs_pep) == 1:
+                        hint_child = next(iter(hint_childs_pep))
+                        indent_level_child = indent_level_curr
+                        func_curr_code = _enqueue_hint_child(pith_curr_expr)
+                    # Else, this union is subscripted by two or more child
+                    # hints. In this case...
+                    else:
+                        # Initialize the list of all substrings of the code
+                        # type-checking the current pith against these arguments
+                        # to the substring prefixing all such code.
+                        func_curr_code_parts = [CODE_PEP484604_UNION_PREFIX]
+
+                        # Python expression yielding the value of the current
+                        # pith in the first test generated for this union,
+                        # defined as either...
+                        pith_curr_expr_next = (
+                            # If this union is subscripted by one or more
+                            # PEP-compliant child hints, the expression
+                            # assigning this value to a local variable
+                            # efficiently reused by all subsequent tests
+                            # generated for this union. Note that this union is
+                            # guaranteed to generate at least one subsequent
+                            # test in this case. Why? Because the "typing"
+                            # module forces unions to be subscripted by two or
+                            # more child hints. By deduction, either this union
+                            # is also subscripted by one or more
+                            # PEP-noncompliant child hints *OR* this union is
+                            # subscripted by two or more PEP-compliant child
+                            # hints.
+                            pith_curr_assign_expr
+                            if hint_childs_pep else
+                            # Else, this union is subscripted by *NO*
+                            # PEP-compliant child hints. Since the first test
+                            # generated for this union is the only test
+                            # generated for this union, prefer the expression
+                            # yielding the value of the current pith *WITHOUT*
+                            # assigning this value to a local variable, which
+                            # would needlessly go unused.
+                            pith_curr_expr
                         )
-                        # print(f'Sanified union child hint to {repr(hint_child)}...')
-
-                        # Sign of this sanified child hint if this hint is
-                        # PEP-compliant *OR* "None" otherwise (i.e., if this
-                        # hint is PEP-noncompliant).
-                        hint_child_sign = get_hint_pep_sign_or_none(hint_child)
 
-                        # If this child hint is itself a child union nested in
-                        # this parent union, explicitly flatten this nested
-                        # union by appending *ALL* child child hints
-                        # subscripting this child union onto this parent union.
-                        #
-                        # Note that this edge case currently *ONLY* arises when
-                        # this child hint has been expanded by the above call to
-                        # the sanify_hint_child() function from a non-union (e.g.,
-                        # "float") into a union (e.g., "float | int"). The
-                        # standard PEP 484-compliant "typing.Union" factory
-                        # already implicitly flattens nested unions: e.g.,
-                        #     >>> from typing import Union
-                        #     >>> Union[float, Union[int, str]]
-                        #     typing.Union[float, int, str]
-                        if hint_child_sign in HINT_SIGNS_UNION:
-                            # Tuple of all child child type hints subscripting
-                            # this child union.
-                            hint_child_childs = get_hint_pep_args(hint_child)
-                            # print(f'Expanding union {repr(hint_curr)} with child union {repr(hint_child_childs)}...')
+                        # If this union is subscripted by one or more
+                        # PEP-noncompliant child hints, generate and append
+                        # efficient code type-checking these child hints
+                        # *BEFORE* less efficient code type-checking any
+                        # PEP-compliant child hints subscripting this union.
+                        if hint_childs_nonpep:
+                            func_curr_code_parts.append(
+                                CODE_PEP484604_UNION_CHILD_NONPEP_format(
+                                    indent_curr=indent_curr,
+                                    # Python expression yielding the value of
+                                    # the current pith.
+                                    pith_curr_expr=pith_curr_expr_next,
+                                    # Python expression evaluating to a tuple of
+                                    # these arguments.
+                                    #
+                                    # Note that:
+                                    # * This ordered set is coerced into a tuple
+                                    #   preserving the order of these arguments.
+                                    #   If this tuple contains only one type,
+                                    #   the add_func_scope_types() function
+                                    #   efficiently reduces to the
+                                    #   add_func_scope_type() function passed
+                                    #   that type.
+                                    # * Since this ordered set is already
+                                    #   duplicate-free, this tuple is guaranteed
+                                    #   to be duplicate-free as well. Instruct
+                                    #   that function to avoid redundantly (and
+                                    #   non-deterministically) deduplicating
+                                    #   this tuple by internally coercing this
+                                    #   tuple back into a set.
+                                    hint_curr_expr=add_func_scope_types(
+                                        types=tuple(hint_childs_nonpep),
+                                        is_unique=True,
+                                        func_scope=func_wrapper_scope,
+                                        exception_prefix=(
+                                            EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL
+                                        ),
+                                    ),
+                                ))
 
-                            # Append these child child type hints to this parent
+                            # Prefer the expression efficiently reusing the
+                            # value assigned to a local variable by the above
+                            # test in all subsequent tests generated for this
                             # union.
-                            hint_childs_new.extend(hint_child_childs)
-                        # Else, this child hint is *NOT* itself a union. In this
-                        # case, append this child hint to this parent union.
-                        else:
-                            hint_childs_new.append(hint_child)
-
-                        # Increment the 0-based index of the currently iterated
-                        # child hint.
-                        hint_childs_index += 1
-
-                    # Freeze this temporary list back to this permanent tuple,
-                    # replacing the prior unflattened contents of this tuple.
-                    hint_childs = tuple(hint_childs_new)
-
-                    # Release this list back to its respective pool.
-                    release_object_typed(hint_childs_new)
-                    # print(f'Flattened union to {repr(hint_childs)}...')
-
-                    # For efficiency, reuse previously created sets of the
-                    # following (when available):
-                    # * "hint_childs_nonpep", the set of all PEP-noncompliant
-                    #   child hints subscripting this union.
-                    # * "hint_childs_pep", the set of all PEP-compliant child
-                    #   hints subscripting this union.
-                    #
-                    # Since these child hints require fundamentally different
-                    # forms of type-checking, prefiltering child hints into
-                    # these sets *BEFORE* generating code type-checking these
-                    # child hints improves both efficiency and maintainability.
-                    hint_childs_nonpep = acquire_object_typed(set)
-                    hint_childs_pep = acquire_object_typed(set)
+                            pith_curr_expr_next = pith_curr_var_name
+                        # Else, this union is subscripted by *NO*
+                        # PEP-noncompliant child hints.
+
+                        # For each PEP-compliant child hint of this union...
+                        for hint_child in hint_childs_pep:
+                            # Code deeply type-checking this child hint.
+                            func_curr_code_parts.append(
+                                CODE_PEP484604_UNION_CHILD_PEP_format(
+                                    indent_curr=indent_curr,
+                                    # Expression yielding the value of this
+                                    # pith.
+                                    hint_child_placeholder=_enqueue_hint_child(
+                                        pith_curr_expr_next)))
 
-                    # Clear these sets prior to use below.
-                    hint_childs_nonpep.clear()
-                    hint_childs_pep.clear()
+                            # Prefer the expression efficiently reusing the
+                            # value assigned to a local variable by either the
+                            # above test or a prior iteration of this test in
+                            # all subsequent tests generated for this union.
+                            pith_curr_expr_next = pith_curr_var_name
 
-                    # For each subscripted argument of this union...
-                    for hint_child in hint_childs:
-                        #FIXME: Uncomment as desired for debugging. This test is
-                        #currently a bit too costly to warrant uncommenting.
-                        # Assert that this child hint is *NOT* shallowly ignorable.
-                        # Why? Because any union containing one or more shallowly
-                        # ignorable child hints is deeply ignorable and should thus
-                        # have already been ignored after a call to the
-                        # is_hint_ignorable() tester passed this union on handling
-                        # the parent hint of this union.
-                        # assert (
-                        #     repr(hint_curr) not in HINTS_REPR_IGNORABLE_SHALLOW), (
-                        #     f'{hint_curr_exception_prefix} {repr(hint_curr)} child '
-                        #     f'{repr(hint_child)} ignorable but not ignored.')
-
-                        # If this child hint is PEP-compliant...
-                        if is_hint_pep(hint_child):
-                            # Filter this child hint into the set of
-                            # PEP-compliant child hints.
-                            #
-                            # Note that this PEP-compliant child hint *CANNOT*
-                            # also be filtered into the set of PEP-noncompliant
-                            # child hints, even if this child hint originates
-                            # from a non-"typing" type (e.g., "List[int]" from
-                            # "list"). Why? Because that would then induce
-                            # false positives when the current pith shallowly
-                            # satisfies this non-"typing" type but does *NOT*
-                            # deeply satisfy this child hint.
-                            hint_childs_pep.add(hint_child)
-                        # Else, this child hint is PEP-noncompliant. In this
-                        # case, filter this child hint into the list of
-                        # PEP-noncompliant arguments.
-                        else:
-                            hint_childs_nonpep.add(hint_child)
-
-                    # Initialize the code type-checking the current pith against
-                    # these arguments to the substring prefixing all such code.
-                    func_curr_code = CODE_PEP484604_UNION_PREFIX
-
-                    # If this union is subscripted by one or more
-                    # PEP-noncompliant child hints, generate and append
-                    # efficient code type-checking these child hints *BEFORE*
-                    # less efficient code type-checking any PEP-compliant child
-                    # hints subscripting this union.
-                    if hint_childs_nonpep:
-                        func_curr_code += (
-                            CODE_PEP484604_UNION_CHILD_NONPEP_format(
-                                # Python expression yielding the value of the
-                                # current pith. Specifically...
-                                pith_curr_expr=(
-                                    # If this union is also subscripted by one
-                                    # or more PEP-compliant child hints, prefer
-                                    # the expression assigning this value to a
-                                    # local variable efficiently reused by
-                                    # subsequent code generated for those
-                                    # PEP-compliant child hints.
-                                    pith_curr_assign_expr
-                                    if hint_childs_pep else
-                                    # Else, this union is subscripted by *NO*
-                                    # PEP-compliant child hints. Since this is
-                                    # the first and only test generated for this
-                                    # union, prefer the expression yielding the
-                                    # value of the current pith *WITHOUT*
-                                    # assigning this value to a local variable,
-                                    # which would needlessly go unused.
-                                    pith_curr_expr
-                                ),
-                                # Python expression evaluating to a tuple of
-                                # these arguments.
-                                #
-                                # Note that we would ideally avoid coercing this
-                                # set into a tuple when this set only contains
-                                # one type by passing that type directly to the
-                                # _add_func_wrapper_local_type() function.
-                                # Sadly, the "set" class defines no convenient
-                                # or efficient means of retrieving the only item
-                                # of a 1-set. Indeed, the most efficient means
-                                # of doing so is to iterate over that set and
-                                # immediately halt iteration:
-                                #     for first_item in muh_set: break
-                                #
-                                # While we *COULD* technically leverage that
-                                # approach here, doing so would also mandate
-                                # adding multiple intermediate tests, mitigating
-                                # any performance gains. Ultimately, we avoid
-                                # doing so by falling back to the usual
-                                # approach. See also this relevant
-                                # self-StackOverflow post:
-                                #       https://stackoverflow.com/a/40054478/2809027
-                                hint_curr_expr=add_func_scope_types(
-                                    types=hint_childs_nonpep,
-                                    func_scope=func_wrapper_scope,
-                                    exception_prefix=(
-                                        EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
-                                ),
-                            ))
+                        # Strip the erroneous " or" suffix appended by the last
+                        # child hint from the last substring of this code. Since
+                        # only that substring is sliced, this avoids copying the
+                        # entire code type-checking this union merely to discard
+                        # its last three characters.
+                        #
+                        # Note that this union is guaranteed to be subscripted
+                        # by one or more unignorable child hints. By definition,
+                        # this union is unignorable; *ALL* child hints
+                        # subscripting an unignorable union are themselves
+                        # unignorable. It follows that the above logic appended
+                        # one or more substrings type-checking one or more child
+                        # hints.
+                        func_curr_code_parts[-1] = (
+                            func_curr_code_parts[-1][:LINE_RSTRIP_INDEX_OR])
 
-                    # For the 0-based index and each child hint of this union...
-                    for hint_child_index, hint_child in enumerate(
-                        hint_childs_pep):
-                        # Code deeply type-checking this child hint.
-                        func_curr_code += CODE_PEP484604_UNION_CHILD_PEP_format(
-                            # Expression yielding the value of this pith.
-                            hint_child_placeholder=_enqueue_hint_child(
-                                # If either...
-                                #
-                                # Then prefer the expression efficiently reusing
-                                # the value previously assigned to a local
-                                # variable by either the above conditional or
-                                # prior iteration of the current conditional.
-                                pith_curr_var_name
-                                if (
-                                    # This union is also subscripted by one or
-                                    # more PEP-noncompliant child hints *OR*...
-                                    hint_childs_nonpep or
-                                    # This is any PEP-compliant child hint
-                                    # *EXCEPT* the first...
-                                    hint_child_index
-                                ) else
-                                # Then this union is not subscripted by any
-                                # PEP-noncompliant child hints *AND* this is the
-                                # first PEP-compliant child hint. In this case,
-                                # preface this code with an expression assigning
-                                # this value to a local variable efficiently
-                                # reused by code generated by subsequent
-                                # iteration.
-                                #
-                                # Note this child hint is guaranteed to be
-                                # followed by at least one more child hint. Why?
-                                # Because the "typing" module forces unions to
-                                # be subscripted by two or more child hints. By
-                                # deduction, those child hints *MUST* be
-                                # PEP-compliant. Ergo, we need *NOT* explicitly
-                                # validate that constraint here.
-                                pith_curr_assign_expr
-                            ))
+                        # Suffix this code by the substring suffixing all such
+                        # code.
+                        func_curr_code_parts.append(
+                            CODE_PEP484604_UNION_SUFFIX_format(
+                                indent_curr=indent_curr))
 
-                    # If this code is *NOT* its initial value, this union is
-                    # subscripted by one or more unignorable child hints and
-                    # the above logic generated code type-checking these child
-                    # hints. In this case...
-                    if func_curr_code is not CODE_PEP484604_UNION_PREFIX:
-                        # Munge this code to...
-                        func_curr_code = (
-                            # Strip the erroneous " or" suffix appended by the
-                            # last child hint from this code.
-                            f'{func_curr_code[:LINE_RSTRIP_INDEX_OR]}'
-                            # Suffix this code by the substring suffixing all
-                            # such code.
-                            f'{CODE_PEP484604_UNION_SUFFIX}'
-                        # Format the "indent_curr" prefix into this code,
-                        # deferred above for efficiency.
-                        ).format(indent_curr=indent_curr)
-                    # Else, this snippet is its initial value and thus
-                    # ignorable.
-
-                    # Release this pair of sets back to their respective pools.
-                    release_object_typed(hint_childs_nonpep)
-                    release_object_typed(hint_childs_pep)
+                        # Concatenate these substrings into code.
+                        #
+                        # Note that the "indent_curr" prefix was already
+                        # formatted into each such substring above. Since this
+                        # code is thus complete, this code is intentionally
+                        # *NOT* reformatted here by yet another redundant pass
+                        # of the str.format() method over this entire code.
+                        func_curr_code = ''.join(func_curr_code_parts)
                 # Else, this hint is *NOT* a union.
                 #
                 # ..........{ CONTAINERS                           }............
@@ -1385,7 +1757,7 @@ def make_check_expr(
                 #   ignorable arguments like tuple[str, ...].
                 # Then this hint is effectively (for all intents and purposes) a
                 # standard single-argument container. In this case...
-                elif hint_curr_sign in HINT_SIGNS_CONTAINER_ARGS_1:
+                elif hint_curr_kind == _HINT_KIND_CONTAINER_ARGS_1:
                     # Python expression evaluating to the origin type of this
                     # hint as a hidden beartype-specific parameter injected into
                     # the signature of this wrapper function.
@@ -1401,10 +1773,10 @@ def make_check_expr(
                     # parent hint, defined as either...
                     hint_child = (
                         # If this parent hint is a variable-length tuple, the
-                        # get_hint_pep_sign() getter called above has already
-                        # validated the contents of this tuple. In this case,
-                        # efficiently get the lone child hint of this parent
-                        # hint *WITHOUT* validation.
+                        # get_hint_pep_sign_or_none() getter called above has
+                        # already validated the contents of this tuple. In this
+                        # case, efficiently get the lone child hint of this
+                        # parent hint *WITHOUT* validation.
                         hint_childs[0]
                         if hint_curr_sign is HintSignTuple else
                         # Else, this hint is a single-argument container, in
@@ -1510,24 +1882,32 @@ def make_check_expr(
                 #   ellipses.
                 #
                 # This is what happens when unreadable APIs are promoted.
-                elif hint_curr_sign is HintSignTupleFixed:
-                    # Initialize the code type-checking this pith against this
-                    # tuple to the substring prefixing all such code.
-                    func_curr_code = CODE_PEP484585_TUPLE_FIXED_PREFIX
+                elif hint_curr_kind == _HINT_KIND_TUPLE_FIXED:
+                    # Initialize the list of all substrings of the code
+                    # type-checking this pith against this tuple to the
+                    # substring prefixing all such code.
+                    func_curr_code_parts = [
+                        CODE_PEP484585_TUPLE_FIXED_PREFIX_format(
+                            indent_curr=indent_curr,
+                            pith_curr_assign_expr=pith_curr_assign_expr,
+                        )]
 
                     # If this hint is the empty fixed-length tuple, generate
                     # and append code type-checking the current pith to be the
                     # empty tuple. This edge case constitutes a code smell.
                     if is_hint_pep484585_tuple_empty(hint_curr):
-                        func_curr_code += (
+                        func_curr_code_parts.append(
                             CODE_PEP484585_TUPLE_FIXED_EMPTY_format(
-                                pith_curr_var_name=pith_curr_var_name))
+                                indent_curr=indent_curr,
+                                pith_curr_var_name=pith_curr_var_name,
+                            ))
                     # Else, that ridiculous edge case does *NOT* apply. In this
                     # case...
                     else:
                         # Append code type-checking the length of this pith.
-                        func_curr_code += (
+                        func_curr_code_parts.append(
                             CODE_PEP484585_TUPLE_FIXED_LEN_format(
+                                indent_curr=indent_curr,
                                 pith_curr_var_name=pith_curr_var_name,
                                 hint_childs_len=hint_childs_len,
                             ))
@@ -1550,7 +1930,8 @@ def make_check_expr(
                             # If this child hint is unignorable, deeply
                             # type-check this child pith.
                             if hint_child is not None:
-                                func_curr_code += CODE_PEP484585_TUPLE_FIXED_NONEMPTY_CHILD_format(
+                                func_curr_code_parts.append(CODE_PEP484585_TUPLE_FIXED_NONEMPTY_CHILD_format(
+                                    indent_curr=indent_curr,
                                     hint_child_placeholder=_enqueue_hint_child(
                                         # Python expression yielding the value
                                         # of the currently indexed item of this
@@ -1561,27 +1942,28 @@ def make_check_expr(
                                             pith_child_index=hint_child_index,
                                         )
                                     ),
-                                )
+                                ))
                             # Else, this child hint is ignorable.
 
-                    # Munge this code to...
-                    func_curr_code = (
-                        # Strip the erroneous " and" suffix appended by the
-                        # last child hint from this code.
-                        f'{func_curr_code[:LINE_RSTRIP_INDEX_AND]}'
-                        # Suffix this code by the substring suffixing all such
-                        # code.
-                        f'{CODE_PEP484585_TUPLE_FIXED_SUFFIX}'
-                    # Format...
-                    ).format(
-                        indent_curr=indent_curr,
-                        pith_curr_assign_expr=pith_curr_assign_expr,
-                    )
+                    # Strip the erroneous " and" suffix appended by the last
+                    # child hint (or by the length or emptiness test if no
+                    # child hints are unignorable) from the last substring of
+                    # this code, avoiding a copy of the entire code.
+                    func_curr_code_parts[-1] = (
+                        func_curr_code_parts[-1][:LINE_RSTRIP_INDEX_AND])
+
+                    # Suffix this code by the substring suffixing all such code.
+                    func_curr_code_parts.append(
+                        CODE_PEP484585_TUPLE_FIXED_SUFFIX_format(
+                            indent_curr=indent_curr))
+
+                    # Concatenate these already formatted substrings into code.
+                    func_curr_code = ''.join(func_curr_code_parts)
                 # Else, this hint is *NOT* a fixed-length tuple.
                 #
                 # ..........{ MAPPINGS                             }............
                 # If this hint is a standard mapping (e.g., "dict[str, int]")...
-                elif hint_curr_sign in HINT_SIGNS_MAPPING:
+                elif hint_curr_kind == _HINT_KIND_MAPPING:
                     # Python expression evaluating to the origin type of this
                     # mapping hint.
                     hint_curr_expr = add_func_scope_type(
@@ -1796,13 +2178,14 @@ def make_check_expr(
                 # beartype-specific (i.e., metahint whose second argument is a
                 # beartype validator produced by subscripting a beartype
                 # validator factory). In this case...
-                elif hint_curr_sign is HintSignAnnotated:
+                elif hint_curr_kind == _HINT_KIND_ANNOTATED:
                     # Defer heavyweight imports.
                     from beartype.vale._core._valecore import BeartypeValidator
 
-                    # Initialize the code type-checking this pith against this
-                    # metahint to the substring prefixing all such code.
-                    func_curr_code = CODE_PEP593_VALIDATOR_PREFIX
+                    # Initialize the list of all substrings of the code
+                    # type-checking this pith against this metahint to the
+                    # substring prefixing all such code.
+                    func_curr_code_parts = [CODE_PEP593_VALIDATOR_PREFIX]
 
                     # Unignorable sane metahint annotating this parent hint
                     # sanified from this possibly ignorable insane metahint *OR*
@@ -1849,24 +2232,32 @@ def make_check_expr(
                     # Else, this metahint is unignorable. In this case...
                     else:
                         # Code deeply type-checking this metahint.
-                        func_curr_code += CODE_PEP593_VALIDATOR_METAHINT_format(
-                            indent_curr=indent_curr,
-                            # Python expression yielding the value of the
-                            # current pith assigned to a local variable
-                            # efficiently reused by code generated by the
-                            # following iteration.
-                            #
-                            # Note this child hint is guaranteed to be followed
-                            # by at least one more test expression referencing
-                            # this local variable. Why? Because the "typing"
-                            # module forces metahints to be subscripted by one
-                            # child hint and one or more arbitrary objects.
-                            # Ergo, we need *NOT* explicitly validate that here.
-                            hint_child_placeholder=_enqueue_hint_child(
-                                pith_curr_assign_expr),
-                        )
+                        func_curr_code_parts.append(
+                            CODE_PEP593_VALIDATOR_METAHINT_format(
+                                indent_curr=indent_curr,
+                                # Python expression yielding the value of the
+                                # current pith assigned to a local variable
+                                # efficiently reused by code generated by the
+                                # following iteration.
+                                #
+                                # Note this child hint is guaranteed to be
+                                # followed by at least one more test expression
+                                # referencing this local variable. Why? Because
+                                # the "typing" module forces metahints to be
+                                # subscripted by one child hint and one or more
+                                # arbitrary objects. Ergo, we need *NOT*
+                                # explicitly validate that here.
+                                hint_child_placeholder=_enqueue_hint_child(
+                                    pith_curr_assign_expr),
+                            ))
                     # Else, this metahint is ignorable.
 
+                    # Python code snippet expanding to the level of indentation
+                    # shared by *ALL* beartype validators annotating this
+                    # metahint, looked up once here rather than once for each
+                    # such validator in the iteration below.
+                    indent_child = INDENT_LEVEL_TO_CODE[indent_level_child]
+
                     # For the 0-based index and each beartype validator
                     # annotating this metahint...
                     for hint_child_index, hint_child in enumerate(hints_child):
@@ -1913,17 +2304,20 @@ def make_check_expr(
                         # Else, this is the first beartype validator. See above.
 
                         # Code deeply type-checking this validator.
-                        func_curr_code += CODE_PEP593_VALIDATOR_IS_format(
-                            indent_curr=indent_curr,
-                            # Python expression formatting the current pith into
-                            # the "{obj}" format substring previously embedded
-                            # by this validator into this code string.
-                            hint_child_expr=hint_child._is_valid_code.format(
-                                # Indentation unique to this child hint.
-                                indent=INDENT_LEVEL_TO_CODE[indent_level_child],
-                                obj=hint_curr_expr,
-                            ),
-                        )
+                        func_curr_code_parts.append(
+                            CODE_PEP593_VALIDATOR_IS_format(
+                                indent_curr=indent_curr,
+                                # Python expression formatting the current pith
+                                # into the "{obj}" format substring previously
+                                # embedded by this validator into this code
+                                # string.
+                                hint_child_expr=(
+                                    hint_child.format_is_valid_code(
+                                        # Indentation unique to this child hint.
+                                        indent=indent_child,
+                                        obj=hint_curr_expr,
+                                    )),
+                            ))
 
                         # Generate locals safely merging the locals required by
                         # both this validator code *AND* the current code
@@ -1933,21 +2327,24 @@ def make_check_expr(
                             mapping_src=hint_child._is_valid_code_locals,
                         )
 
-                    # Munge this code to...
-                    func_curr_code = (
-                        # Strip the erroneous " and" suffix appended by the
-                        # last child hint from this code.
-                        f'{func_curr_code[:LINE_RSTRIP_INDEX_AND]}'
-                        # Suffix this code by the substring suffixing all such
-                        # code.
-                        f'{CODE_PEP593_VALIDATOR_SUFFIX_format(indent_curr=indent_curr)}'
-                    )
+                    # Strip the erroneous " and" suffix appended by the last
+                    # child hint from the last substring of this code.
+                    func_curr_code_parts[-1] = (
+                        func_curr_code_parts[-1][:LINE_RSTRIP_INDEX_AND])
+
+                    # Suffix this code by the substring suffixing all such code.
+                    func_curr_code_parts.append(
+                        CODE_PEP593_VALIDATOR_SUFFIX_format(
+                            indent_curr=indent_curr))
+
+                    # Concatenate these substrings into code.
+                    func_curr_code = ''.join(func_curr_code_parts)
                 # Else, this hint is *NOT* a metahint.
                 #
                 # ............{ SUBCLASS                           }............
                 # If this hint is either a PEP 484- or 585-compliant subclass
                 # type hint...
-                elif hint_curr_sign is HintSignType:
+                elif hint_curr_kind == _HINT_KIND_TYPE:
                     # Unignorable sane child hint sanified from this possibly
                     # ignorable insane child hint *OR* "None" otherwise (i.e.,
                     # if this child hint is ignorable).
@@ -2059,7 +2456,7 @@ def make_check_expr(
                 #   pseudo-superclasses) *OR*...
                 #
                 # ...then this hint is a PEP-compliant generic. In this case...
-                elif hint_curr_sign is HintSignGeneric:
+                elif hint_curr_kind == _HINT_KIND_GENERIC:
                     #FIXME: *THIS IS NON-IDEAL.* Ideally, we should propagate
                     #*ALL* child type hints subscripting a generic up to *ALL*
                     #pseudo-superclasses of that generic (e.g., the "int" child
@@ -2094,9 +2491,10 @@ def make_check_expr(
                         hint=hint_curr, exception_prefix=EXCEPTION_PREFIX)
                     # print(f'Visiting generic type {repr(hint_curr)}...')
 
-                    # Initialize the code type-checking this pith against this
-                    # generic to the substring prefixing all such code.
-                    func_curr_code = CODE_PEP484585_GENERIC_PREFIX
+                    # Initialize the list of all substrings of the code
+                    # type-checking this pith against this generic to the
+                    # substring prefixing all such code.
+                    func_curr_code_parts = [CODE_PEP484585_GENERIC_PREFIX]
 
                     # For each unignorable unerased transitive pseudo-superclass
                     # originally declared as a superclass of this generic...
@@ -2110,23 +2508,24 @@ def make_check_expr(
 
                         # Generate and append code type-checking this pith
                         # against this superclass.
-                        func_curr_code += CODE_PEP484585_GENERIC_CHILD_format(
-                            hint_child_placeholder=_enqueue_hint_child(
-                                # Python expression efficiently reusing the
-                                # value of this pith previously assigned to a
-                                # local variable by the prior expression.
-                                pith_curr_var_name))
-
-                    # Munge this code to...
-                    func_curr_code = (
-                        # Strip the erroneous " and" suffix appended by the
-                        # last child hint from this code.
-                        f'{func_curr_code[:LINE_RSTRIP_INDEX_AND]}'
-                        # Suffix this code by the substring suffixing all such
-                        # code.
-                        f'{CODE_PEP484585_GENERIC_SUFFIX}'
-                    # Format...
-                    ).format(
+                        func_curr_code_parts.append(
+                            CODE_PEP484585_GENERIC_CHILD_format(
+                                hint_child_placeholder=_enqueue_hint_child(
+                                    # Python expression efficiently reusing the
+                                    # value of this pith previously assigned to
+                                    # a local variable by the prior expression.
+                                    pith_curr_var_name)))
+
+                    # Strip the erroneous " and" suffix appended by the last
+                    # child hint from the last substring of this code.
+                    func_curr_code_parts[-1] = (
+                        func_curr_code_parts[-1][:LINE_RSTRIP_INDEX_AND])
+
+                    # Suffix this code by the substring suffixing all such code.
+                    func_curr_code_parts.append(CODE_PEP484585_GENERIC_SUFFIX)
+
+                    # Concatenate these substrings into code and format...
+                    func_curr_code = ''.join(func_curr_code_parts).format(
                         # Indentation deferred above for efficiency.
                         indent_curr=indent_curr,
                         pith_curr_assign_expr=pith_curr_assign_expr,
@@ -2150,7 +2549,7 @@ def make_check_expr(
                 # which is sufficiently limiting as to render this singleton
                 # patently absurd and a farce that we weep to even implement.
                 # In this case...
-                elif hint_curr_sign is HintSignLiteral:
+                elif hint_curr_kind == _HINT_KIND_LITERAL:
                     # Tuple of zero or more literal objects subscripting this
                     # hint, intentionally replacing the current such tuple due
                     # to the non-standard implementation of the third-party
@@ -2158,18 +2557,12 @@ def make_check_expr(
                     hint_childs = get_hint_pep586_literals(
                         hint=hint_curr, exception_prefix=EXCEPTION_PREFIX)
 
-                    # Initialize the code type-checking this pith against this
-                    # hint to the substring prefixing all such code.
-                    func_curr_code = CODE_PEP586_PREFIX_format(
+                    # Initialize the list of all substrings of the code
+                    # type-checking this pith against this hint to the
+                    # substring prefixing all such code.
+                    func_curr_code_parts = [CODE_PEP586_PREFIX_format(
                         pith_curr_assign_expr=pith_curr_assign_expr,
 
-                        #FIXME: If "typing.Literal" is ever extended to support
-                        #substantially more types (and thus actually becomes
-                        #useful), optimize the construction of the "types" set
-                        #below to instead leverage a similar
-                        #"acquire_object_typed(set)" caching solution as that
-                        #currently employed for unions. For now, we only shrug.
-
                         # Python expression evaluating to a tuple of the unique
                         # types of all literal objects subscripting this hint.
                         hint_child_types_expr=add_func_scope_types(
@@ -2184,13 +2577,13 @@ def make_check_expr(
                             exception_prefix=(
                                 EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
                         ),
-                    )
+                    )]
 
                     # For each literal object subscripting this hint...
                     for hint_child in hint_childs:
                         # Generate and append efficient code type-checking
                         # this data validator by embedding this code as is.
-                        func_curr_code += CODE_PEP586_LITERAL_format(
+                        func_curr_code_parts.append(CODE_PEP586_LITERAL_format(
                             pith_curr_var_name=pith_curr_var_name,
                             # Python expression evaluating to this object.
                             hint_child_expr=add_func_scope_attr(
@@ -2199,16 +2592,21 @@ def make_check_expr(
                                 exception_prefix=(
                                     EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
                             ),
-                        )
+                        ))
 
-                    # Munge this code to...
-                    func_curr_code = (
-                        # Strip the erroneous " or" suffix appended by the last
-                        # child hint from this code.
-                        f'{func_curr_code[:LINE_RSTRIP_INDEX_OR]}'
-                        # Suffix this code by the appropriate substring.
-                        f'{CODE_PEP586_SUFFIX}'
-                    ).format(indent_curr=indent_curr)
+                    # Strip the erroneous " or" suffix appended by the last
+                    # child hint from the last substring of this code.
+                    func_curr_code_parts[-1] = (
+                        func_curr_code_parts[-1][:LINE_RSTRIP_INDEX_OR])
+
+                    # Suffix this code by the appropriate substring.
+                    func_curr_code_parts.append(CODE_PEP586_SUFFIX)
+
+                    # Concatenate these substrings into code and format the
+                    # "indent_curr" prefix into this code, deferred above for
+                    # efficiency.
+                    func_curr_code = ''.join(func_curr_code_parts).format(
+                        indent_curr=indent_curr)
                 # Else, this hint is *NOT* a PEP 586-compliant type hint.
 
                 # ............{ UNSUPPORTED                        }............
@@ -2227,34 +2625,11 @@ def make_check_expr(
         # ................{ NON-PEP                            }................
         # Else, this hint is *NOT* PEP-compliant.
         #
-        # ................{ NON-PEP ~ type                     }................
-        # If this hint is a non-"typing" class...
-        #
-        # Note that:
-        # * This test is intentionally performed *AFTER* that testing whether
-        #   this hint is PEP-compliant, thus guaranteeing this hint to be a
-        #   PEP-noncompliant non-"typing" class rather than a PEP-compliant
-        #   type hint originating from such a class. Since many hints are both
-        #   PEP-compliant *AND* originate from such a class (e.g., the "List"
-        #   in "List[int]", PEP-compliant but originating from the
-        #   PEP-noncompliant builtin class "list"), testing these hints first
-        #   for PEP-compliance ensures we generate non-trivial code deeply
-        #   type-checking these hints instead of trivial code only shallowly
-        #   type-checking the non-"typing" classes from which they originate.
-        # * This class is guaranteed to be a subscripted argument of a
-        #   PEP-compliant type hint (e.g., the "int" in "Union[Dict[str, str],
-        #   int]") rather than the root type hint. Why? Because if this class
-        #   were the root type hint, it would have already been passed into a
-        #   faster submodule generating PEP-noncompliant code instead.
-        elif isinstance(hint_curr, type):
-            # Python expression evaluating to this type.
-            hint_curr_expr = add_func_scope_type(
-                cls=hint_curr,
-                func_scope=func_wrapper_scope,
-                exception_prefix=EXCEPTION_PREFIX_HINT,
-            )
         # ................{ NON-PEP ~ bad                      }................
-        # Else, this hint is neither PEP-compliant *NOR* a class. In this case,
+        # Else, this hint is neither PEP-compliant *NOR* a class. Why not a
+        # class? Because the _enqueue_hint_child() closure directly generates
+        # code type-checking PEP-noncompliant classes *WITHOUT* enqueueing
+        # those classes, which this search thus never visits. In this case,
         # raise an exception. Note that:
         # * This should *NEVER* happen, as the "typing" module goes to great
         #   lengths to validate the integrity of PEP-compliant types at
@@ -2282,42 +2657,105 @@ def make_check_expr(
                 f'expression undefined.'
             )
 
-            func_curr_code = CODE_PEP484_INSTANCE_format(
-                pith_curr_expr=pith_curr_expr,
-                hint_curr_expr=hint_curr_expr,
+            func_curr_code = CODE_PEP484_INSTANCE % (
+                pith_curr_expr,
+                hint_curr_expr,
             )
         # Else, prior logic generated a code snippet type-checking the current
         # pith against the currently visited hint. Preserve this snippet.
 
-        # Inject this code into the body of this wrapper.
-        func_wrapper_code = replace_str_substrs(
-            text=func_wrapper_code,
-            old=hint_curr_placeholder,
-            new=func_curr_code,
-        )
-
-        # Nullify the metadata describing the previously visited hint in this
-        # list for safety.
-        hints_meta[hints_meta_index_curr] = None
+        # Record this code for subsequent expansion into the body of this
+        # wrapper *AFTER* this search visits all child hints of this hint.
+        hints_meta_code[hints_meta_index_curr] = func_curr_code
 
         # Increment the 0-based index of metadata describing the next visited
-        # hint in the "hints_meta" list *BEFORE* visiting that hint but *AFTER*
-        # performing all other logic for the currently visited hint.
+        # hint in the "hints_meta_*" lists *BEFORE* visiting that hint but
+        # *AFTER* performing all other logic for the currently visited hint.
         hints_meta_index_curr += 1
 
-    # ..................{ CLEANUP                            }..................
-    # Release the fixed list of all such metadata.
-    release_fixed_list(hints_meta)
+    # ..................{ EXPAND                             }..................
+    # Replace all placeholder strings embedded in the code snippets generated
+    # above with the code snippets type-checking the child hints identified by
+    # those placeholders.
+    #
+    # Note that:
+    # * Each child hint is necessarily visited *AFTER* its parent hint by the
+    #   breadth-first search above and thus resides at a strictly larger index
+    #   of the "hints_meta_code" list than that parent hint. Iterating over
+    #   this list in reverse thus guarantees that each placeholder embedded in
+    #   the code snippet type-checking each hint refers to a code snippet that
+    #   has already been fully expanded.
+    # * Each code snippet is scanned exactly once by a precompiled regular
+    #   expression. Globally replacing each placeholder in the entire (and
+    #   ever-growing) code snippet to be returned would instead require one
+    #   full scan of that snippet for each visited hint, scaling quadratically
+    #   with the complexity of the root hint.
+    while hints_meta_index_last >= 0:
+        # Code snippet type-checking the hint at this index.
+        func_curr_code = hints_meta_code[hints_meta_index_last]
+
+        # If this code embeds one or more placeholders...
+        if CODE_HINT_CHILD_PLACEHOLDER_PREFIX in func_curr_code:
+            # List of all substrings of this code split on these placeholders,
+            # such that each odd-indexed item is the 0-based index of a child
+            # hint captured by this regular expression and each even-indexed
+            # item is code preceding or following that placeholder.
+            func_curr_code_substrs = CODE_HINT_CHILD_PLACEHOLDER_REGEX.split(
+                func_curr_code)
+
+            # For the index of each such child hint in this list...
+            for func_curr_code_substrs_index in range(
+                1, len(func_curr_code_substrs), 2):
+                # 0-based index of this child hint in the "hints_meta_code" list.
+                hints_meta_index_child = int(
+                    func_curr_code_substrs[func_curr_code_substrs_index])
+
+                # Replace this index with the fully expanded code snippet
+                # type-checking this child hint.
+                func_curr_code_substrs[func_curr_code_substrs_index] = (
+                    hints_meta_code[hints_meta_index_child])
+
+                # Nullify that code snippet for safety. Since each child hint
+                # is enqueued by exactly one parent hint, that code snippet is
+                # now unreachable.
+                hints_meta_code[hints_meta_index_child] = None
+
+            # Replace this code with this code fully expanded.
+            hints_meta_code[hints_meta_index_last] = ''.join(
+                func_curr_code_substrs)
+        # Else, this code embeds *NO* placeholders and is thus fully expanded.
+
+        # Decrement the 0-based index of the next hint to be expanded.
+        hints_meta_index_last -= 1
+
+    # Python code snippet to be returned, type-checking the root pith against
+    # the root hint.
+    func_wrapper_code = hints_meta_code[0]
 
-    # If the Python code snippet to be returned remains unchanged from its
-    # initial value, the breadth-first search above failed to generate code. In
-    # this case, raise an exception.
+    # ..................{ CLEANUP                            }..................
+    # Nullify this code snippet in this list for safety.
+    hints_meta_code[0] = None
+
+    # Nullify all object metadata describing all previously visited hints in
+    # these lists for safety, avoiding retaining references to objects (e.g.,
+    # hints) that would otherwise prevent their garbage collection. Integer
+    # metadata is intentionally preserved as is, as integers are harmless (and
+    # typically interned by CPython anyway).
     #
-    # Note that this test is inexpensive, as the third character of the
-    # "func_root_code" code snippet is guaranteed to differ from that of
-    # "func_wrapper_code" code snippet if this function behaved as expected,
-    # which it should have... but may not have, which is why we're testing.
-    if func_wrapper_code == func_root_code:
+    # Note that:
+    # * The breadth-first search above visited exactly the first
+    #   "hints_meta_index_curr" items of these lists.
+    # * Nullifying these items here with one slice assignment per list is
+    #   faster than nullifying each item on visiting that item above.
+    # * Slice assignments preserving the length of these lists are safe, as
+    #   these fixed lists only prohibit operations changing their lengths.
+    hints_meta_nones = [None] * hints_meta_index_curr
+    hints_meta_hint[:hints_meta_index_curr] = hints_meta_nones
+    hints_meta_pith_expr[:hints_meta_index_curr] = hints_meta_nones
+
+    # If the breadth-first search above failed to generate code, raise an
+    # exception.
+    if not func_wrapper_code:
         raise BeartypeDecorHintPepException(
             f'{EXCEPTION_PREFIX_HINT}{repr(hint_root)} unchecked.')
     # Else, the breadth-first search above successfully generated code.
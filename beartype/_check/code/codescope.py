@@ -50,9 +50,11 @@ This private submodule is *not* intended for importation by downstream callers.
 from beartype.roar import BeartypeDecorHintNonpepException
 from beartype.typing import (
     Dict,
+    FrozenSet,
     List,
     Optional,
     Tuple,
+    Union,
 )
 from beartype._cave._cavemap import NoneTypeOr
 from beartype._check.forward.reference.fwdrefmake import (
@@ -508,13 +510,32 @@ def add_func_scope_types(
         f'{exception_prefix}{repr(types)} not tuple.')
 
     # ....................{ CACHE                          }....................
+    # Key uniquely identifying this tuple in the tuple union cache, defined as
+    # either...
+    types_key: _TupleUnionKey = (
+        # If the caller guaranteed this tuple to be duplicate-free, this tuple
+        # as is, thus preserving the caller-defined ordering of these types;
+        types
+        if is_unique else
+        # Else, the caller failed to guarantee this tuple to be duplicate-free,
+        # in which case this function has already discarded that ordering
+        # above. In this case, the frozen set of these types, thus reducing
+        # *ALL* tuples containing the same types regardless of ordering and
+        # duplicates (e.g., "(int, str)", "(str, int)", "(str, int, str)") to
+        # the same cached tuple.
+        frozenset(types)
+    )
+
+    # Previously cached tuple identified by this key if any *OR* "None".
+    types_cached = _tuple_union_to_tuple_union.get(types_key)
+
     # If this tuple has *NOT* already been cached, do so.
-    if types not in _tuple_union_to_tuple_union:
-        _tuple_union_to_tuple_union[types] = types
+    if types_cached is None:
+        _tuple_union_to_tuple_union[types_key] = types
     # Else, this tuple has already been cached. In this case, deduplicate this
     # tuple by reusing the previously cached tuple.
     else:
-        types = _tuple_union_to_tuple_union[types]
+        types = types_cached
 
     # ....................{ RETURN                         }....................
     # Return the name of a new parameter passing this tuple.
@@ -630,11 +651,24 @@ def express_func_scope_type_ref(
     # Return a 2-tuple of this expression and set of unqualified classnames.
     return ref_expr, forwardrefs_class_basename
 
+# ....................{ PRIVATE ~ hints                    }....................
+_TupleUnionKey = Union[TupleTypes, FrozenSet[type]]
+'''
+PEP-compliant type hint matching each key of the
+:data:`._tuple_union_to_tuple_union` cache, which is either:
+
+* A tuple union whose caller guaranteed that union to be duplicate-free and
+  thus ordered.
+* A frozen set of the types in a tuple union whose caller failed to guarantee
+  that union to be duplicate-free and thus unordered.
+'''
+
 # ....................{ PRIVATE ~ globals                  }....................
-_tuple_union_to_tuple_union: Dict[TupleTypes, TupleTypes] = {}
+_tuple_union_to_tuple_union: Dict[_TupleUnionKey, TupleTypes] = {}
 '''
 **Tuple union cache** (i.e., dictionary mapping from each tuple union passed to
-the :func:`.add_func_scope_types` adder to that same union, preventing tuple
+the :func:`.add_func_scope_types` adder *or* the frozen set of the types in
+that union if that union is unordered to that same union, preventing tuple
 unions from being duplicated across calls to that adder).
 
 This cache serves a dual purpose. Notably, this cache both enables:
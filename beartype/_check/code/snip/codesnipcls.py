@@ -14,8 +14,88 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype._check.checkmagic import VAR_NAME_PITH_PREFIX
+from beartype._check.code.snip.codesnipstr import (
+    CODE_HINT_CHILD_PLACEHOLDER_PREFIX,
+    CODE_HINT_CHILD_PLACEHOLDER_SUFFIX,
+)
 
 # ....................{ SUBCLASSES                         }....................
+class HintIndexToHintPlaceholder(dict):
+    '''
+    **Hint placeholder cache** (i.e., dictionary mapping from the 0-based index
+    uniquely identifying each type hint visited by the breadth-first search
+    (BFS) in the :func:`beartype._check.code.codemake.make_check_expr` factory
+    to the corresponding **placeholder hint child type-checking substring**
+    (i.e., placeholder to be subsequently replaced by a Python code snippet
+    type-checking the current pith against that hint)).
+
+    Each such placeholder is intentionally prefixed and suffixed by characters
+    that:
+
+    * Are invalid as Python code, guaranteeing that the top-level call to the
+      :func:`exec` builtin performed by the :func:`beartype.beartype` decorator
+      will raise a :exc:`SyntaxError` exception if the caller fails to replace
+      *all* placeholders.
+    * Protect the index embedded in this placeholder against ambiguous matches
+      of larger indices containing this index (e.g., the index ``1`` contained
+      in the index ``10``).
+
+    See Also
+    --------
+    :data:`.HINT_INDEX_TO_HINT_PLACEHOLDER`
+        Singleton instance of this dictionary subclass.
+    '''
+
+    # ....................{ CLASS VARIABLES                }....................
+    # Slot *NO* instance variables, preventing this singleton from lazily
+    # creating an unused instance dictionary ("__dict__") and minimizing the
+    # space consumed by this dictionary subclass.
+    __slots__ = ()
+
+    # ....................{ DUNDERS                        }....................
+    def __missing__(self, hint_index: int) -> str:
+        '''
+        Dunder method explicitly called by the superclass
+        :meth:`dict.__getitem__` method implicitly called on the first ``[``-
+        and ``]``-delimited attempt to access a hint placeholder uniquely
+        identified by the passed 0-based index.
+
+        Parameters
+        ----------
+        hint_index : int
+            0-based index embedded in the hint placeholder to be created,
+            cached, and returned.
+
+        Returns
+        -------
+        str
+            Hint placeholder uniquely identified by this index.
+
+        Raises
+        ------
+        AssertionError
+            If either:
+
+            * ``hint_index`` is *not* an integer.
+            * ``hint_index`` is a **negative integer** (i.e., less than 0).
+        '''
+        assert isinstance(hint_index, int), f'{repr(hint_index)} not integer.'
+        assert hint_index >= 0, f'{hint_index} < 0.'
+
+        # Hint placeholder uniquely identified by this index.
+        hint_placeholder = (
+            f'{CODE_HINT_CHILD_PLACEHOLDER_PREFIX}'
+            f'{hint_index}'
+            f'{CODE_HINT_CHILD_PLACEHOLDER_SUFFIX}'
+        )
+
+        # Cache this placeholder.
+        self[hint_index] = hint_placeholder
+
+        # Return this placeholder.
+        return hint_placeholder
+
+
 class PithIndexToVarName(dict):
     '''
     **Local pith variable name cache** (i.e., dictionary mapping from the
@@ -31,6 +111,12 @@ class PithIndexToVarName(dict):
         Singleton instance of this dictionary subclass.
     '''
 
+    # ....................{ CLASS VARIABLES                }....................
+    # Slot *NO* instance variables, preventing this singleton from lazily
+    # creating an unused instance dictionary ("__dict__") and minimizing the
+    # space consumed by this dictionary subclass.
+    __slots__ = ()
+
     # ....................{ DUNDERS                        }....................
     def __missing__(self, pith_index: int) -> str:
         '''
@@ -72,6 +158,36 @@ class PithIndexToVarName(dict):
         return pith_var_name
 
 # ....................{ MAPPINGS                           }....................
+HINT_INDEX_TO_HINT_PLACEHOLDER = HintIndexToHintPlaceholder()
+'''
+**Hint placeholder cache singleton** (i.e., global dictionary efficiently
+mapping from the 0-based index uniquely identifying each type hint visited by
+the breadth-first search (BFS) in the
+:func:`beartype._check.code.codemake.make_check_expr` factory to the
+corresponding placeholder substring).
+
+Caveats
+-------
+**Hint placeholders should always be accessed via this cache rather than
+manually generated.** Since that BFS rarely visits more than a few hundred type
+hints, the same placeholders recur across *all* calls to that factory. This
+cache dynamically creates and efficiently caches these placeholders on the first
+access of those placeholders, obviating the performance cost of string
+formatting required to create these placeholders on each such call.
+
+Examples
+--------
+.. code-block:: pycon
+
+   >>> from beartype._check.code.snip.codesnipcls import (
+   ...     HINT_INDEX_TO_HINT_PLACEHOLDER)
+   >>> HINT_INDEX_TO_HINT_PLACEHOLDER[0]
+   '@[0)!'
+   >>> HINT_INDEX_TO_HINT_PLACEHOLDER[1]
+   '@[1)!'
+'''
+
+
 PITH_INDEX_TO_VAR_NAME = PithIndexToVarName()
 '''
 **Indentation cache singleton** (i.e., global dictionary efficiently mapping
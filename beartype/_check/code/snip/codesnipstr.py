@@ -16,6 +16,10 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype._data.hint.datahinttyping import CallableStrFormat
+from re import (
+    compile as re_compile,
+    escape as re_escape,
+)
 
 # ....................{ HINT ~ placeholder : child         }....................
 CODE_HINT_CHILD_PLACEHOLDER_PREFIX = '@['
@@ -35,6 +39,24 @@ current pith expression against the currently iterated child hint of the
 currently visited parent hint).
 '''
 
+
+CODE_HINT_CHILD_PLACEHOLDER_REGEX = re_compile(
+    f'{re_escape(CODE_HINT_CHILD_PLACEHOLDER_PREFIX)}'
+    r'([0-9]+)'
+    f'{re_escape(CODE_HINT_CHILD_PLACEHOLDER_SUFFIX)}'
+)
+'''
+Compiled regular expression matching each **placeholder hint child
+type-checking substring** (i.e., substring prefixed by
+:data:`.CODE_HINT_CHILD_PLACEHOLDER_PREFIX` and suffixed by
+:data:`.CODE_HINT_CHILD_PLACEHOLDER_SUFFIX`), capturing the 0-based integer
+uniquely identifying the child hint embedded in that substring as the first
+match group.
+
+This expression enables *all* placeholders in a code snippet to be replaced in a
+single linear pass rather than one pass per placeholder.
+'''
+
 # ....................{ HINT ~ placeholder : forwardref    }....................
 CODE_HINT_REF_TYPE_BASENAME_PLACEHOLDER_PREFIX = '${FORWARDREF:'
 '''
@@ -91,14 +113,25 @@ Python expression.
 # '''
 
 # ....................{ HINT ~ pep : 484 : instance        }....................
-CODE_PEP484_INSTANCE = '''isinstance({pith_curr_expr}, {hint_curr_expr})'''
+CODE_PEP484_INSTANCE = '''isinstance(%s, %s)'''
 '''
 :pep:`484`-compliant code snippet type-checking the current pith against the
 current child PEP-compliant type expected to be a trivial non-:mod:`typing`
 type (e.g., :class:`int`, :class:`str`).
 
+This snippet is intended to be interpolated via the ``%`` operator with a
+2-tuple ``(pith_curr_expr, hint_curr_expr)`` of the Python expressions yielding
+the current pith and evaluating to that type (respectively).
+
 Caveats
 -------
+**This snippet is intentionally formatted with the ``%`` operator rather than
+the :meth:`str.format` method.** This is the most frequently formatted snippet
+by far, formatted at least once for each isinstanceable type visitable from
+each type hint. Since ``%``-style formatting of positional arguments avoids the
+method lookup and keyword argument packing inherent to :meth:`str.format`, the
+former is measurably faster than the latter for short snippets like this.
+
 **This snippet is intentionally compact rather than embedding a human-readable
 comment.** For example, this snippet intentionally avoids doing this:
 
@@ -116,8 +149,6 @@ failed hard after breaking everything. **Avoid the mistakes of the past.**
 # ..................{ FORMATTERS                             }..................
 # str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
 # This is an absurd micro-optimization. *fight me, github developer community*
-CODE_PEP484_INSTANCE_format: CallableStrFormat = (
-    CODE_PEP484_INSTANCE.format)
 # CODE_PEP572_PITH_ASSIGN_AND_format: CallableStrFormat = (
 #     CODE_PEP572_PITH_ASSIGN_AND.format)
 CODE_PEP572_PITH_ASSIGN_EXPR_format: CallableStrFormat = (
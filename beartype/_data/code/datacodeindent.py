@@ -23,6 +23,12 @@ class _IndentLevelToCode(dict):
         Singleton instance of this dictionary subclass.
     '''
 
+    # ....................{ CLASS VARIABLES                }....................
+    # Slot *NO* instance variables, preventing this singleton from lazily
+    # creating an unused instance dictionary ("__dict__") and minimizing the
+    # space consumed by this dictionary subclass.
+    __slots__ = ()
+
     # ....................{ DUNDERS                        }....................
     def __missing__(self, indent_level: int) -> str:
         '''
@@ -221,8 +221,8 @@ itemized :class:`typing.Tuple` type of the form ``typing.Tuple[{typename1},
 
 
 CODE_PEP484585_TUPLE_FIXED_EMPTY = '''
-{{indent_curr}}    # True only if this tuple is empty.
-{{indent_curr}}    not {pith_curr_var_name} and'''
+{indent_curr}    # True only if this tuple is empty.
+{indent_curr}    not {pith_curr_var_name} and'''
 '''
 :pep:`484`- and :pep:`585`-compliant code snippet prefixing all code
 type-checking the current pith to be empty against an itemized
@@ -236,8 +236,8 @@ See Also
 
 
 CODE_PEP484585_TUPLE_FIXED_LEN = '''
-{{indent_curr}}    # True only if this tuple is of the expected length.
-{{indent_curr}}    len({pith_curr_var_name}) == {hint_childs_len} and'''
+{indent_curr}    # True only if this tuple is of the expected length.
+{indent_curr}    len({pith_curr_var_name}) == {hint_childs_len} and'''
 '''
 :pep:`484`- and :pep:`585`-compliant code snippet prefixing all code
 type-checking the current pith to be of the expected length against an itemized
@@ -251,9 +251,9 @@ See Also
 
 
 CODE_PEP484585_TUPLE_FIXED_NONEMPTY_CHILD = '''
-{{indent_curr}}    # True only if this item of this non-empty tuple deeply
-{{indent_curr}}    # satisfies this child hint.
-{{indent_curr}}    {hint_child_placeholder} and'''
+{indent_curr}    # True only if this item of this non-empty tuple deeply
+{indent_curr}    # satisfies this child hint.
+{indent_curr}    {hint_child_placeholder} and'''
 '''
 :pep:`484`- and :pep:`585`-compliant code snippet type-checking the current pith
 against the current child hint subscripting an itemized :class:`typing.Tuple`
@@ -266,10 +266,11 @@ applying this snippet to the last subscripted child hint of an itemized
 :class:`typing.Tuple` type. While there exist alternate and more readable means
 of accomplishing this, this approach is the optimally efficient.
 
-The ``{indent_curr}`` format variable is intentionally brace-protected to
-efficiently defer its interpolation until the complete PEP-compliant code
-snippet type-checking the current pith against *all* subscripted arguments of
-this parent type has been generated.
+The ``{indent_curr}`` format variable is interpolated into this snippet when
+formatting this snippet rather than deferred until the complete code
+type-checking the current pith against *all* subscripted child hints of this
+parent type has been generated, avoiding a redundant :meth:`str.format` pass
+over that complete code.
 '''
 
 
@@ -322,6 +323,10 @@ CODE_PEP484585_SEQUENCE_ARGS_1_PITH_CHILD_EXPR_format: CallableStrFormat = (
     CODE_PEP484585_SEQUENCE_ARGS_1_PITH_CHILD_EXPR.format)
 CODE_PEP484585_SUBCLASS_format: CallableStrFormat = (
     CODE_PEP484585_SUBCLASS.format)
+CODE_PEP484585_TUPLE_FIXED_PREFIX_format: CallableStrFormat = (
+    CODE_PEP484585_TUPLE_FIXED_PREFIX.format)
+CODE_PEP484585_TUPLE_FIXED_SUFFIX_format: CallableStrFormat = (
+    CODE_PEP484585_TUPLE_FIXED_SUFFIX.format)
 CODE_PEP484585_TUPLE_FIXED_EMPTY_format: CallableStrFormat = (
     CODE_PEP484585_TUPLE_FIXED_EMPTY.format)
 CODE_PEP484585_TUPLE_FIXED_LEN_format: CallableStrFormat = (
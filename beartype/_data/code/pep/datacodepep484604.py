@@ -32,8 +32,8 @@ pith against each subscripted argument of a :class:`typing.Union` type hint.
 
 
 CODE_PEP484604_UNION_CHILD_NONPEP = '''
-{{indent_curr}}    # True only if this pith is of one of these types.
-{{indent_curr}}    isinstance({pith_curr_expr}, {hint_curr_expr}) or'''
+{indent_curr}    # True only if this pith is of one of these types.
+{indent_curr}    isinstance({pith_curr_expr}, {hint_curr_expr}) or'''
 '''
 :pep:`484`-compliant code snippet type-checking the current pith against the
 current PEP-noncompliant child argument subscripting a parent
@@ -47,7 +47,7 @@ See Also
 
 
 CODE_PEP484604_UNION_CHILD_PEP = '''
-{{indent_curr}}    {hint_child_placeholder} or'''
+{indent_curr}    {hint_child_placeholder} or'''
 '''
 :pep:`484`-compliant code snippet type-checking the current pith against the
 current PEP-compliant child argument subscripting a parent :class:`typing.Union`
@@ -60,15 +60,18 @@ applying this snippet to the last subscripted argument of such a hint. While
 there exist alternate and more readable means of accomplishing this, this
 approach is the optimally efficient.
 
-The ``{indent_curr}`` format variable is intentionally brace-protected to
-efficiently defer its interpolation until the complete PEP-compliant code
-snippet type-checking the current pith against *all* subscripted arguments of
-this parent hint has been generated.
+The ``{indent_curr}`` format variable is interpolated into this snippet when
+formatting this snippet rather than deferred until the complete code
+type-checking the current pith against *all* subscripted arguments of this
+parent hint has been generated, avoiding a redundant :meth:`str.format` pass
+over that complete code.
 '''
 
 # ....................{ FORMATTERS                         }....................
 # str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
 # This is an absurd micro-optimization. *fight me, github developer community*
+CODE_PEP484604_UNION_SUFFIX_format: CallableStrFormat = (
+    CODE_PEP484604_UNION_SUFFIX.format)
 CODE_PEP484604_UNION_CHILD_PEP_format: CallableStrFormat = (
     CODE_PEP484604_UNION_CHILD_PEP.format)
 CODE_PEP484604_UNION_CHILD_NONPEP_format: CallableStrFormat = (
@@ -48,8 +48,21 @@ def die_if_mappings_two_items_collide(
     assert isinstance(mapping_a, Mapping), f'{repr(mapping_a)} not mapping.'
     assert isinstance(mapping_b, Mapping), f'{repr(mapping_b)} not mapping.'
 
-    # For each key of the first mapping...
-    for mapping_a_key in mapping_a:
+    # Smaller and larger of these two mappings (respectively). Since key-value
+    # collisions are symmetric, iterating over the keys of the smaller mapping
+    # suffices. Doing so avoids repeatedly iterating over *ALL* keys of a large
+    # and growing mapping repeatedly merged with small mappings (e.g., the
+    # scope of a type-checking wrapper function repeatedly merged with the
+    # small scopes of beartype validators), which would otherwise scale
+    # quadratically with the number of such merges.
+    mapping_small, mapping_large = (
+        (mapping_a, mapping_b)
+        if len(mapping_a) <= len(mapping_b) else
+        (mapping_b, mapping_a)
+    )
+
+    # For each key of the smaller mapping...
+    for mapping_small_key in mapping_small:
         # If...
         #
         # Note this simplistic detection logic has been exhaustively optimized
@@ -58,11 +71,12 @@ def die_if_mappings_two_items_collide(
         # dict.get()) are *DRAMATICALLY* slower -- which is really fascinating.
         # CPython appears to have internally optimized pure dictionary syntax.
         if (
-            # This key resides in the second mapping as well *AND*...
-            mapping_a_key in mapping_b and
-            # This key unsafely maps to a different value in the second
+            # This key resides in the larger mapping as well *AND*...
+            mapping_small_key in mapping_large and
+            # This key unsafely maps to a different value in the larger
             # mapping...
-            mapping_a[mapping_a_key] is not mapping_b[mapping_a_key]
+            mapping_small[mapping_small_key] is not (
+                mapping_large[mapping_small_key])
         ):
         # Immediately short-circuit this iteration to raise an exception below.
         # Merging these mappings would silently and thus unsafely override the
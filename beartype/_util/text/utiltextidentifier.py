@@ -14,6 +14,7 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                            }....................
 from beartype.roar._roarexc import _BeartypeUtilTextIdentifierException
 from beartype._data.hint.datahinttyping import TypeException
+from beartype._util.cache.utilcachecall import callable_cached
 
 # ....................{ RAISERS                            }....................
 def die_unless_identifier(
@@ -131,10 +132,50 @@ def is_identifier(text: str) -> bool:
         return text.isidentifier()
     # Else, this text contains one or more "." delimiters and is thus expected
     # to be a qualified Python identifier.
+    #
+    # Return true only if this qualified Python identifier is valid. Since
+    # validating qualified identifiers is substantially slower than validating
+    # unqualified identifiers *AND* since the same qualified identifiers (e.g.,
+    # fully-qualified forward references) are typically validated repeatedly,
+    # defer to a memoized tester validating only the former.
+    return _is_identifier_qualified(text)
+
+# ....................{ PRIVATE ~ testers                  }....................
+@callable_cached
+def _is_identifier_qualified(text: str) -> bool:
+    '''
+    :data:`True` only if the passed string containing one or more ``.``
+    delimiters is a valid **qualified Python attribute name** (i.e.,
+    ``.``-delimited concatenation of two or more :pep:`3131`-compliant
+    syntactically valid Python identifiers).
+
+    This tester is memoized for efficiency. Memoization is intentionally
+    restricted to qualified names, as testing unqualified names trivially
+    reduces to a single call to the :meth:`str.isidentifier` builtin faster
+    than a memoized lookup.
+
+    Parameters
+    ----------
+    text : str
+        String containing one or more ``.`` delimiters to be inspected.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this string is the ``.``-delimited concatenation of
+        two or more syntactically valid Python identifiers.
+
+    See Also
+    --------
+    :func:`.is_identifier`
+        Further details.
+    '''
+    assert '.' in text, f'{repr(text)} contains no "." delimiters.'
 
     # Return true only if *ALL* "."-delimited substrings split from this string
     # are valid unqualified Python identifiers. Note that:
-    # * Regular expressions report false negatives. See the docstring.
+    # * Regular expressions report false negatives. See the docstring of the
+    #   public is_identifier() tester.
     # * Manual iteration is significantly faster than "all(...)"- and
     #   "any(...)"-style comprehensions.
     # * This approach correctly handles *ALL* edge cases, including when:
@@ -17,6 +17,10 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype.roar import BeartypeValeSubscriptionException
+from beartype.typing import (
+    Dict,
+    Tuple,
+)
 from beartype.vale._util._valeutilfunc import die_unless_validator_tester
 from beartype.vale._util._valeutiltext import format_diagnosis_line
 from beartype.vale._util._valeutiltyping import (
@@ -70,6 +74,11 @@ class BeartypeValidator(object):
         **Validator code local scope** (i.e., dictionary mapping from the name
         to value of each local attribute referenced in :attr:`code`) required
         to dynamically compile this validator code into byte code at runtime.
+    _is_valid_code_format_cache : dict[tuple[str, str], str]
+        **Validator code format cache** (i.e., dictionary mapping from each
+        2-tuple ``(indent, obj)`` previously passed to the
+        :meth:`format_is_valid_code` method to the validator code formatted
+        with that indentation and test subject expression).
 
     See Also
     ----------
@@ -89,6 +98,7 @@ class BeartypeValidator(object):
         '_get_repr',
         '_is_valid',
         '_is_valid_code',
+        '_is_valid_code_format_cache',
         '_is_valid_code_locals',
     )
 
@@ -229,6 +239,9 @@ class BeartypeValidator(object):
         self._is_valid_code = is_valid_code
         self._is_valid_code_locals = is_valid_code_locals
 
+        # Initialize all remaining instance variables.
+        self._is_valid_code_format_cache: Dict[Tuple[str, str], str] = {}
+
     # ..................{ PROPERTIES ~ read-only             }..................
     # Properties with no corresponding setter and thus read-only.
 
@@ -459,6 +472,48 @@ class BeartypeValidator(object):
             is_obj_valid=is_obj_valid,
         )
 
+
+    def format_is_valid_code(self, indent: str, obj: str) -> str:
+        '''
+        **Validator code** (i.e., Python code snippet validating an arbitrary
+        object against this validator) formatted with the passed indentation
+        and test subject expression.
+
+        This method is memoized for efficiency. Since the same validator is
+        commonly type-checked at the same indentation against the same test
+        subject expression across multiple type hints, this method formats this
+        code with the comparatively slow :meth:`str.format` method only on the
+        first call passed each such pair of strings.
+
+        Parameters
+        ----------
+        indent : str
+            Line-oriented indentation globally replacing all ``"{indent}"``
+            substrings in this code.
+        obj : str
+            Python expression yielding the test subject to be validated,
+            globally replacing all ``"{obj}"`` substrings in this code.
+
+        Returns
+        -------
+        str
+            Validator code formatted with this indentation and expression.
+        '''
+
+        # Validator code formatted with these strings if previously formatted
+        # *OR* "None" otherwise.
+        is_valid_code = self._is_valid_code_format_cache.get((indent, obj))
+
+        # If this code has yet to be formatted with these strings...
+        if is_valid_code is None:
+            # Format and cache this code with these strings.
+            is_valid_code = self._is_valid_code_format_cache[(indent, obj)] = (
+                self._is_valid_code.format(indent=indent, obj=obj))
+        # Else, this code has already been formatted with these strings.
+
+        # Return this code.
+        return is_valid_code
+
     # ..................{ DUNDERS ~ operator                 }..................
     # Define a domain-specific language (DSL) enabling callers to dynamically
     # synthesize higher-level validators from lower-level validators via
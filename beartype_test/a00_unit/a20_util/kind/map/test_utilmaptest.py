@@ -35,6 +35,18 @@ def test_die_if_mappings_two_items_collide() -> None:
     )
     from pytest import raises
 
+    # Assert this validator raises *NO* exception when passed two mappings of
+    # differing sizes containing only safe key-value collisions (i.e., shared
+    # keys associated with the same values), regardless of their order.
+    THE_SONG_OF_HIAWATHA_SUBSET = dict(
+        (key, THE_SONG_OF_HIAWATHA[key])
+        for key in tuple(THE_SONG_OF_HIAWATHA)[:1]
+    )
+    die_if_mappings_two_items_collide(
+        THE_SONG_OF_HIAWATHA, THE_SONG_OF_HIAWATHA_SUBSET)
+    die_if_mappings_two_items_collide(
+        THE_SONG_OF_HIAWATHA_SUBSET, THE_SONG_OF_HIAWATHA)
+
     # Assert this validator raises the expected exception when passed two
     # non-empty mappings containing one or more key-value collisions whose
     # values are all hashable.
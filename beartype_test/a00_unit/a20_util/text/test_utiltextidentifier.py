@@ -76,3 +76,32 @@ def test_is_identifier() -> None:
     # Assert this tester rejects an unqualified Python identifier suffixed by a
     # non-empty string prefixed by a digit.
     assert is_identifier('Sentient.6') is False
+
+
+def test_is_identifier_qualified() -> None:
+    '''
+    Test the private
+    :func:`beartype._util.text.utiltextidentifier._is_identifier_qualified`
+    tester.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.text.utiltextidentifier import _is_identifier_qualified
+
+    # Fully-qualified Python identifier.
+    identifier = 'A_violet.by_a_mossy.stone_3'
+
+    # Equal but non-identical copy of this identifier, dynamically constructed
+    # at runtime to avoid being interned as the same object as that identifier.
+    identifier_copy = ''.join(('A_violet.by_a_', 'mossy.stone_3'))
+
+    # Assert this tester accepts this identifier when repeatedly passed either
+    # this identifier or an equal copy of this identifier.
+    assert _is_identifier_qualified(identifier) is True
+    assert _is_identifier_qualified(identifier) is True
+    assert _is_identifier_qualified(identifier_copy) is True
+
+    # Assert this tester rejects the same invalid fully-qualified Python
+    # identifier when repeatedly passed that identifier.
+    assert _is_identifier_qualified('Half.hidden.4.the_eye') is False
+    assert _is_identifier_qualified('Half.hidden.4.the_eye') is False
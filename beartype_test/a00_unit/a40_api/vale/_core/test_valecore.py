@@ -82,6 +82,18 @@ def test_api_vale_validator_pass() -> None:
     assert 'Someone had blundered.' in repr(validator_delimited)
     assert repr(validator_repr_str) == 'All that was left of them,'
 
+    # Assert that a beartype validator formats its code with the passed test
+    # subject expression.
+    validator_undelimited_code = validator_undelimited.format_is_valid_code(
+        indent='    ', obj='rode_the_six_hundred')
+    assert validator_undelimited_code == (
+        "(rode_the_six_hundred == 'All in the valley of Death')")
+
+    # Assert that a beartype validator caches its code formatted with the same
+    # indentation and test subject expression.
+    assert validator_undelimited.format_is_valid_code(
+        indent='    ', obj='rode_the_six_hundred') is validator_undelimited_code
+
 
 def test_api_vale_validator_fail() -> None:
     '''
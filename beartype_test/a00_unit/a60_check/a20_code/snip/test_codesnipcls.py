@@ -7,7 +7,7 @@
 Beartype **type-checking expression snippet class unit tests.**
 
 This submodule unit tests the public API of the public
-:mod:`beartype._check.code.snip.codesnipcls.PITH_INDEX_TO_VAR_NAME` submodule.
+:mod:`beartype._check.code.snip.codesnipcls` submodule.
 '''
 
 # ....................{ IMPORTS                            }....................
@@ -17,6 +17,62 @@ This submodule unit tests the public API of the public
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
 # ....................{ TESTS                              }....................
+def test_hint_index_to_hint_placeholder() -> None:
+    '''
+    Test the
+    :obj:`beartype._check.code.snip.codesnipcls.HINT_INDEX_TO_HINT_PLACEHOLDER`
+    dictionary singleton.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype._check.code.snip.codesnipcls import (
+        HINT_INDEX_TO_HINT_PLACEHOLDER)
+    from beartype._check.code.snip.codesnipstr import (
+        CODE_HINT_CHILD_PLACEHOLDER_PREFIX,
+        CODE_HINT_CHILD_PLACEHOLDER_REGEX,
+        CODE_HINT_CHILD_PLACEHOLDER_SUFFIX,
+    )
+    from pytest import raises
+
+    # ....................{ PASS                           }....................
+    # Assert this dictionary indexed by various non-negative integers creates
+    # and returns the expected hint placeholders.
+    assert HINT_INDEX_TO_HINT_PLACEHOLDER[0] == (
+        f'{CODE_HINT_CHILD_PLACEHOLDER_PREFIX}0'
+        f'{CODE_HINT_CHILD_PLACEHOLDER_SUFFIX}'
+    )
+    assert HINT_INDEX_TO_HINT_PLACEHOLDER[10] == (
+        f'{CODE_HINT_CHILD_PLACEHOLDER_PREFIX}10'
+        f'{CODE_HINT_CHILD_PLACEHOLDER_SUFFIX}'
+    )
+
+    # Assert this dictionary internally caches these placeholders.
+    assert HINT_INDEX_TO_HINT_PLACEHOLDER[0] is (
+        HINT_INDEX_TO_HINT_PLACEHOLDER[0])
+    assert HINT_INDEX_TO_HINT_PLACEHOLDER[10] is (
+        HINT_INDEX_TO_HINT_PLACEHOLDER[10])
+
+    # Assert this dictionary is slotted and thus lacks an instance dictionary.
+    assert not hasattr(HINT_INDEX_TO_HINT_PLACEHOLDER, '__dict__')
+
+    # Assert the regular expression matching these placeholders captures the
+    # index embedded in these placeholders.
+    assert CODE_HINT_CHILD_PLACEHOLDER_REGEX.fullmatch(
+        HINT_INDEX_TO_HINT_PLACEHOLDER[10]).group(1) == '10'
+
+    # ....................{ FAIL                           }....................
+    # Assert that attempting to index this dictionary by non-integer indices
+    # raises the expected exception.
+    with raises(AssertionError):
+        HINT_INDEX_TO_HINT_PLACEHOLDER[2.34]
+
+    # Assert that attempting to index this dictionary by negative indices
+    # raises the expected exception.
+    with raises(AssertionError):
+        HINT_INDEX_TO_HINT_PLACEHOLDER[-1]
+
+
 def test_pith_index_to_var_name() -> None:
     '''
     Test the :obj:`beartype._check.code.snip.codesnipcls.PITH_INDEX_TO_VAR_NAME`
@@ -39,6 +95,9 @@ def test_pith_index_to_var_name() -> None:
     assert PITH_INDEX_TO_VAR_NAME[1] is PITH_INDEX_TO_VAR_NAME[1]
     assert PITH_INDEX_TO_VAR_NAME[2] is PITH_INDEX_TO_VAR_NAME[2]
 
+    # Assert this dictionary is slotted and thus lacks an instance dictionary.
+    assert not hasattr(PITH_INDEX_TO_VAR_NAME, '__dict__')
+
     # ....................{ FAIL                           }....................
     # Assert that attempting to index this dictionary by non-integer indices
     # raises the expected exception.
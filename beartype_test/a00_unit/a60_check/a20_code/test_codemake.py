@@ -33,3 +33,73 @@ def test_make_check_code_decoration() -> None:
         make_check_expr(str, BEARTYPE_CONF_DEFAULT) is
         make_check_expr(str, BEARTYPE_CONF_DEFAULT)
     )
+
+# ....................{ TESTS ~ fail                       }....................
+def test_make_check_code_fail_release(monkeypatch: 'pytest.MonkeyPatch') -> None:
+    '''
+    Test that the :func:`beartype._check.code.codemake.make_check_expr`
+    function releases all fixed lists it acquires even when raising an
+    exception.
+
+    Parameters
+    ----------
+    monkeypatch : MonkeyPatch
+        :mod:`pytest` fixture allowing various state associated with the active
+        Python process to be temporarily changed for the duration of this test.
+    '''
+
+    # Defer test-specific imports.
+    from beartype.roar import BeartypeDecorHintPep593Exception
+    from beartype.typing import (
+        Annotated,
+        List,
+    )
+    from beartype.vale import IsEqual
+    from beartype._check.code import codemake
+    from beartype._check.code.codemake import make_check_expr
+    from beartype._conf.confcommon import BEARTYPE_CONF_DEFAULT
+    from beartype._util.cache.pool.utilcachepoollistfixed import (
+        acquire_fixed_list,
+        release_fixed_list,
+    )
+    from pytest import raises
+
+    # Lists of all fixed lists acquired and released by that function.
+    fixed_lists_acquired = []
+    fixed_lists_released = []
+
+    def acquire_fixed_list_recorded(size: int):
+        fixed_list = acquire_fixed_list(size)
+        fixed_lists_acquired.append(fixed_list)
+        return fixed_list
+
+    def release_fixed_list_recorded(fixed_list) -> None:
+        fixed_lists_released.append(fixed_list)
+        release_fixed_list(fixed_list)
+
+    # Record all fixed lists acquired and released by that function.
+    monkeypatch.setattr(
+        codemake, 'acquire_fixed_list', acquire_fixed_list_recorded)
+    monkeypatch.setattr(
+        codemake, 'release_fixed_list', release_fixed_list_recorded)
+
+    # Assert that function raises the expected exception when passed a hint
+    # whose child hint is invalid and thus only detected by the breadth-first
+    # search performed by that function *AFTER* acquiring these lists.
+    with raises(BeartypeDecorHintPep593Exception):
+        make_check_expr(
+            List[Annotated[int, IsEqual[0xBEEF], 'And the rocks, and thine']],
+            BEARTYPE_CONF_DEFAULT,
+        )
+
+    # Assert that function released all fixed lists it acquired.
+    assert fixed_lists_acquired
+    assert (
+        sorted(map(id, fixed_lists_acquired)) ==
+        sorted(map(id, fixed_lists_released))
+    )
+
+    # Assert that function still generates code for a valid hint afterwards.
+    func_wrapper_code, _, _ = make_check_expr(
+        List[Annotated[int, IsEqual[0xBEEF]]], BEARTYPE_CONF_DEFAULT)
+    assert func_wrapper_code
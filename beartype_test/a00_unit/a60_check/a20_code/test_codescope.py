@@ -176,6 +176,16 @@ def test_add_func_scope_types() -> None:
     assert func_scope[types_scope_name_b] == types_b
     assert func_scope[types_scope_name_a] != func_scope[types_scope_name_b]
 
+    # Assert this function registers tuples containing the same types in
+    # different orders and with differing duplicates to the same object when
+    # the caller fails to guarantee these tuples to be duplicate-free.
+    types_scope_name_a = add_func_scope_types(
+        types=(int, str, int,), func_scope=func_scope, is_unique=False)
+    types_scope_name_b = add_func_scope_types(
+        types=(str, int, str,), func_scope=func_scope, is_unique=False)
+    assert set(func_scope[types_scope_name_a]) == {int, str}
+    assert func_scope[types_scope_name_a] is func_scope[types_scope_name_b]
+
     # ....................{ PASS ~ forwardref              }....................
     # Assert that this function implicitly reorders tuples containing:
     # * One or more forward reference proxies.
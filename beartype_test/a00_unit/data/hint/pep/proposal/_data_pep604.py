@@ -43,6 +43,7 @@ def hints_pep604_meta() -> 'List[HintPepMetadata]':
         HintPithSatisfiedMetadata,
         HintPithUnsatisfiedMetadata,
     )
+    from typing import NewType
 
     # ..................{ TUPLES                             }..................
     # Add PEP 604-specific test type hints to this tuple global.
@@ -104,6 +105,37 @@ def hints_pep604_meta() -> 'List[HintPepMetadata]':
             ),
         ),
 
+        # Union of one PEP 585-compliant type hint and a new type encapsulating
+        # that same type hint, exercising an edge case in which this union
+        # reduces to only one PEP-compliant child hint after sanifying and
+        # deduplicating these child hints. Note that new types overload the "|"
+        # operator to create "typing.Union" rather than "types.UnionType"
+        # objects; this union is thus a "typing" type.
+        HintPepMetadata(
+            hint=list[int] | NewType('TotallyNotAListOfInts', list[int]),
+            pep_sign=HintSignUnion,
+            piths_meta=(
+                # List of integer constants.
+                HintPithSatisfiedMetadata([0xDEADBED, 0xACCEDE]),
+                # String constant.
+                HintPithUnsatisfiedMetadata(
+                    pith='Redundantly, abundantly recondite',
+                    # Match that the exception message raised for this object
+                    # declares the type *NOT* satisfied by this object.
+                    exception_str_match_regexes=(r'\blist\b',),
+                ),
+                # List of string constants.
+                HintPithUnsatisfiedMetadata(
+                    pith=['Reconditioned into one list of one kind'],
+                    # Match that the exception message raised for this object
+                    # declares the index of the list item *NOT* satisfying
+                    # this hint.
+                    exception_str_match_regexes=(
+                        r'\b[Ll]ist index 0 item str\b',),
+                ),
+            ),
+        ),
+
         # ................{ NEW UNION ~ nested                 }................
         # Nested unions exercising edge cases induced by Python >= 3.8
         # optimizations leveraging PEP 572-style assignment expressions.
@@ -3255,6 +3255,57 @@ def hints_pep484_meta() -> 'List[HintPepMetadata]':
             ),
         ),
 
+        # Union of one non-"typing" type and a new type encapsulating that same
+        # type, exercising an edge case in which this union reduces to only one
+        # child hint after sanifying and deduplicating these child hints.
+        HintPepMetadata(
+            hint=Union[str, NewType('TotallyNotAStr', str)],
+            pep_sign=HintSignUnion,
+            typehint_cls=UnionTypeHint,
+            piths_meta=(
+                # String constant.
+                HintPithSatisfiedMetadata(
+                    'Of this deduplicated, this reduplicated tautology'),
+                # Integer constant.
+                HintPithUnsatisfiedMetadata(
+                    pith=0xBADDEED,
+                    # Match that the exception message raised for this object
+                    # declares the type *NOT* satisfied by this object.
+                    exception_str_match_regexes=(r'\bstr\b',),
+                ),
+            ),
+        ),
+
+        # Union of one "typing" type and a new type encapsulating that same
+        # "typing" type, exercising an edge case in which this union reduces to
+        # only one PEP-compliant child hint after sanifying and deduplicating
+        # these child hints.
+        HintPepMetadata(
+            hint=Union[List[int], NewType('TotallyNotAListOfInts', List[int])],
+            pep_sign=HintSignUnion,
+            warning_type=PEP585_DEPRECATION_WARNING,
+            typehint_cls=UnionTypeHint,
+            piths_meta=(
+                # List of integer constants.
+                HintPithSatisfiedMetadata([0xFEEDBAC, 0xCAFED]),
+                # String constant.
+                HintPithUnsatisfiedMetadata(
+                    pith='Though the tautology thrice reduplicated',
+                    # Match that the exception message raised for this object
+                    # declares the type *NOT* satisfied by this object.
+                    exception_str_match_regexes=(r'\blist\b',),
+                ),
+                # List of string constants.
+                HintPithUnsatisfiedMetadata(
+                    pith=['Dwindles to one list, one iterated check'],
+                    # Match that the exception message raised for this object
+                    # declares the item *NOT* satisfying this hint.
+                    exception_str_match_regexes=(
+                        r'\bList index 0 item str\b',),
+                ),
+            ),
+        ),
+
         # Union of three non-"typing" types and an originative "typing" type of
         # a union of three non-"typing" types and an originative "typing" type,
         # exercising a prominent edge case when raising human-readable